@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+import contextlib
+import io
+import math
+import os
+import statistics
+import sys
+import timeit
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+import utils
+from runner import execution, manifest, synthetic
+from runner.bench import format_seconds
+
+
+def time_part(unit, path, repeat):
+    cmd = execution.get_part(unit).cmd
+
+    # The parsed input cache is emptied before every run, so that parsing (which also scales) is timed too.
+    with utils.using_input(path), contextlib.redirect_stdout(io.StringIO()):
+        return min(timeit.repeat(cmd, setup=utils.INPUT_CACHE.clear, number=1, repeat=repeat))
+
+
+def fit_exponent(scales, seconds):
+    # The slope of log(time) against log(scale) is the exponent k in time ~ scale^k.
+    if len(seconds) < 2:
+        return None
+    slope, _ = statistics.linear_regression([math.log(scale) for scale in scales], [math.log(t) for t in seconds])
+    return slope
+
+
+@click.command()
+@click.argument('day', type=int)
+@click.option('-y', '--year', type=int, required=True)
+@click.option('--scales', default='250,500,1000,2000', show_default=True)
+@click.option('--repeat', type=int, default=3, show_default=True)
+@click.option('--seed', type=int, default=0, show_default=True)
+@click.option('--budget', type=float, default=10.0, show_default=True)
+# pylint: disable=too-many-arguments,too-many-locals
+def cli(day, year, scales, repeat, seed, budget):
+    try:
+        synthetic.check(year, day)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+    scales = sorted(int(scale) for scale in scales.split(','))
+    units = [execution.Unit(year, day, part_id) for part_id in sorted(manifest.get_parts(year)[day])]
+    seconds = {unit: [] for unit in units}
+
+    for scale in scales:
+        path = synthetic.generate(year, day, scale, seed)
+
+        # Once a part takes longer than the budget, it isn't run at any larger scale.
+        for unit in units:
+            if seconds[unit] and seconds[unit][-1] > budget:
+                continue
+            seconds[unit].append(time_part(unit, path, repeat))
+
+    print(f'{"scale":>8}  ' + '  '.join(f'{"part " + unit.part_id:>12}' for unit in units))
+    for i, scale in enumerate(scales):
+        print(f'{scale:>8}  ' + '  '.join(
+            f'{format_seconds(seconds[unit][i]) if i < len(seconds[unit]) else "-":>12}' for unit in units
+        ))
+
+    exponents = [fit_exponent(scales[:len(seconds[unit])], seconds[unit]) for unit in units]
+    print(f'{"fit":>8}  ' + '  '.join(
+        f'{f"O(n^{exponent:.2f})" if exponent is not None else "-":>12}' for exponent in exponents
+    ))
+
+
+if __name__ == '__main__':
+    cli()  # pylint: disable=no-value-for-parameter
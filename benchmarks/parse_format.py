@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+import os
+import random
+import sys
+import timeit
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils  # pylint: disable=wrong-import-position
+
+parse = utils.lazy_import('parse')
+
+
+FORMAT = 'Sensor at x={:d}, y={:d}: closest beacon is at x={:d}, y={:d}'
+
+
+def get_content(lines, seed):
+    rng = random.Random(seed)
+    return '\n'.join(
+        FORMAT.replace('{:d}', '{}').format(*(rng.randint(-4_000_000, 4_000_000) for _ in range(4)))
+        for _ in range(lines)
+    )
+
+
+def parse_per_line(content):
+    # This is how a format was parsed before it was compiled once per input.
+    return [parse.parse(FORMAT, line) for line in content.rstrip().split('\n')]
+
+
+@click.command()
+@click.option('--lines', type=int, default=200_000, show_default=True)
+@click.option('--repeat', type=int, default=3, show_default=True)
+@click.option('--seed', type=int, default=0, show_default=True)
+def cli(lines, repeat, seed):
+    content = get_content(lines, seed)
+    assert [tuple(result) for result in parse_per_line(content)] == utils.parse(content, format=FORMAT)
+
+    candidates = {
+        'parse.parse per line': lambda: parse_per_line(content),
+        'utils.parse (tuples)': lambda: utils.parse(content, format=FORMAT),
+        'utils.parse (columns)': lambda: utils.parse(content, format=FORMAT, format_output='columns'),
+        'utils.parse (array)': lambda: utils.parse(content, format=FORMAT, format_output='array'),
+    }
+
+    baseline = None
+    for name, func in candidates.items():
+        seconds = min(timeit.repeat(func, number=1, repeat=repeat))
+        baseline = baseline or seconds
+        print(f'{name:<24} {seconds:8.3f}s  {baseline / seconds:6.2f}x')
+
+
+if __name__ == '__main__':
+    cli()  # pylint: disable=no-value-for-parameter
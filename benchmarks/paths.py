@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import timeit
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+import utils
+from utils import paths
+
+np = utils.lazy_import('numpy')
+nx = utils.lazy_import('networkx')
+
+
+def get_graph(grid, weight):
+    # This is how 2021/15 used to weigh its grid before handing it to networkx.
+    graph = grid.to_graph()
+    for u, v in graph.edges():
+        graph.edges[u, v]['weight'] = weight(grid[u], grid[v])
+    return graph
+
+
+def get_benchmarks(size, seed):
+    costs = np.random.default_rng(seed).integers(1, 10, (size, size))
+    grid = utils.DirectedDenseGrid(costs, parse_graph=False)
+    start, end = (0, 0), (size - 1, size - 1)
+    start_index, end_index = grid.get_index(start), grid.get_index(end)
+
+    weighted = get_graph(grid, lambda source, target: target)
+    zero_one = get_graph(grid, lambda source, target: target % 2)
+    weighted_csr = grid.to_csr(weight=lambda source, target: target)
+    zero_one_csr = grid.to_csr(weight=lambda source, target: target % 2)
+    unweighted_csr = grid.to_csr()
+    heuristic = paths.manhattan_heuristic(size, end_index)
+
+    return {
+        'build': [
+            ('networkx', lambda: get_graph(grid, lambda source, target: target).number_of_edges()),
+            ('to_csr', lambda: len(grid.to_csr(weight=lambda source, target: target).indices)),
+        ],
+        'bfs': [
+            ('networkx', lambda: nx.shortest_path_length(weighted, start, end)),
+            ('paths.bfs', lambda: paths.bfs(unweighted_csr, start_index, end_index)[end_index]),
+        ],
+        '0-1 bfs': [
+            ('networkx', lambda: nx.dijkstra_path_length(zero_one, start, end)),
+            ('paths.dijkstra', lambda: paths.dijkstra(zero_one_csr, start_index, end_index)[end_index]),
+            ('paths.bfs_01', lambda: paths.bfs_01(zero_one_csr, start_index, end_index)[end_index]),
+        ],
+        'dijkstra': [
+            ('networkx', lambda: nx.dijkstra_path_length(weighted, start, end)),
+            ('paths.dijkstra', lambda: paths.dijkstra(weighted_csr, start_index, end_index)[end_index]),
+            ('paths.astar', lambda: paths.astar(weighted_csr, start_index, end_index, heuristic)),
+            ('paths.grid_dijkstra', lambda: paths.grid_dijkstra(costs, [start], end)[end]),
+        ],
+    }
+
+
+@click.command()
+@click.option('--size', type=int, default=300, show_default=True)
+@click.option('--repeat', type=int, default=3, show_default=True)
+@click.option('--seed', type=int, default=0, show_default=True)
+def cli(size, repeat, seed):
+    # Every candidate has to come up with the same result (the number of edges, or a distance) as networkx does.
+    for name, candidates in get_benchmarks(size, seed).items():
+        print(f'{name} ({size}x{size} grid)')
+
+        expected = None
+        baseline = None
+        for candidate, func in candidates:
+            distance = func()
+            expected = distance if expected is None else expected
+            assert distance == expected, f'{candidate} found {distance} rather than {expected}'
+
+            seconds = min(timeit.repeat(func, number=1, repeat=repeat))
+            baseline = baseline or seconds
+            print(f'  {candidate:<22} {seconds:8.3f}s  {baseline / seconds:6.2f}x')
+
+
+if __name__ == '__main__':
+    cli()  # pylint: disable=no-value-for-parameter
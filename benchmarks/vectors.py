@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import timeit
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils  # pylint: disable=wrong-import-position
+
+
+def get_operations(cls, dims):
+    a = cls(*range(1, dims + 1))
+    b = cls(*range(dims, 0, -1))
+    coordinates = tuple(range(dims))
+
+    return {
+        'construct': lambda: cls(*coordinates),
+        'add': lambda: a + b,
+        'sub': lambda: a - b,
+        'mul': lambda: a * 3,
+        'dist': lambda: a.dist(b),
+        'neighbors': lambda: list(a.neighbors()),
+    }
+
+
+@click.command()
+@click.option('--number', type=int, default=200_000, show_default=True)
+@click.option('--repeat', type=int, default=3, show_default=True)
+def cli(number, repeat):
+    for dims, cls in [(2, utils.Vector2D), (3, utils.Vector3D)]:
+        # Both types have to give the same results, as the same tuples.
+        generic, fixed = get_operations(utils.Vector, dims), get_operations(cls, dims)
+        for name, operation in generic.items():
+            assert operation() == fixed[name](), name
+
+        print(f'{"operation":<12} {"Vector":>10} {cls.__name__:>10}  speedup')
+        for name in generic:
+            seconds = [min(timeit.repeat(ops[name], number=number, repeat=repeat)) / number for ops in [generic, fixed]]
+            print(f'{name:<12} {seconds[0] * 1e9:8.0f}ns {seconds[1] * 1e9:8.0f}ns  {seconds[0] / seconds[1]:6.2f}x')
+        print()
+
+
+if __name__ == '__main__':
+    cli()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+
+import sys
+
+from runner import client
+
+
+if __name__ == '__main__':
+    sys.exit(client.connect(sys.argv[1:]))
@@ -7,6 +7,8 @@ import sys
 
 import click
 
+from runner import synthetic
+
 PRE_PART_2 = """
 import utils
 
@@ -53,9 +55,28 @@ def get_template(problem):
 
 
 @click.command()
-@click.argument('problem', nargs=1, type=int)
+@click.argument('problem', nargs=1, type=int, required=False)
 @click.option('-y', '--year', type=int, default=datetime.datetime.now().year, show_default=True)
-def cli(problem, year):
+@click.option(
+    '--synthetic',
+    'synthetic_day',
+    type=int,
+    help=f'Write a synthetic input for this day instead (only for {synthetic.get_available()}).',
+)
+@click.option('--scale', type=click.IntRange(min=1), default=1000, show_default=True)
+@click.option('--seed', type=int, default=0, show_default=True)
+# pylint: disable=too-many-arguments
+def cli(problem, year, synthetic_day, scale, seed):
+    if synthetic_day is not None:
+        try:
+            print(synthetic.generate(year, synthetic_day, scale, seed))
+        except ValueError as e:
+            raise click.ClickException(str(e)) from e
+        return
+
+    if problem is None:
+        raise click.UsageError('Either a problem or --synthetic is required')
+
     directory = os.path.join(os.getcwd(), f'problems_{year}')
     os.makedirs(directory, exist_ok=True)
 
@@ -2,10 +2,10 @@ import collections
 import enum
 import fractions
 
-import numpy as np
-
 import utils
 
+np = utils.lazy_import('numpy')
+
 
 class Direction(enum.Enum):
     MINUS = -1
@@ -1,11 +1,11 @@
 import enum
 
-import numpy as np
-
 import utils
 
 from problems_2019 import intcode
 
+np = utils.lazy_import('numpy')
+
 
 class Color(enum.Enum):
     BLACK = 0
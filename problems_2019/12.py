@@ -3,10 +3,10 @@ import itertools
 import math
 import re
 
-import numpy as np
-
 import utils
 
+np = utils.lazy_import('numpy')
+
 
 # This matches against input of the form <x=int, y=int, z=int>, where "int" can be
 # any integer, positive or negative, and captures each of the coordinates in a group
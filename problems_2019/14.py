@@ -1,7 +1,7 @@
-import networkx as nx
-
 import utils
 
+nx = utils.lazy_import('networkx')
+
 
 ONE_TRILLION = 1_000_000_000_000
 
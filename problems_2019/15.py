@@ -1,13 +1,13 @@
 import collections
 import enum
 
-import networkx as nx
-import numpy as np
-
 import utils
 
 from problems_2019 import intcode
 
+np = utils.lazy_import('numpy')
+nx = utils.lazy_import('networkx')
+
 
 class Direction(enum.Enum):
     NORTH = 1
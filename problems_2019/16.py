@@ -1,7 +1,7 @@
-import numpy as np
-
 import utils
 
+np = utils.lazy_import('numpy')
+
 
 # TODO: fix for offsets
 def interpolate(signal, offset=0):
@@ -31,23 +31,21 @@ def interpolate(signal, offset=0):
 
 @utils.part
 def part_1():
-    signal = utils.get_input(delimiter='', cast=int)[0]
+    signal = utils.get_digit_grid()[0]
 
     for _ in range(100):
         signal = interpolate(signal)
 
-    print(''.join(str(digit) for digit in signal))
+    return ''.join(str(digit) for digit in signal)
 
 
 @utils.part
 def part_2():
-    signal = utils.get_input(delimiter=None, cast=str)[0]
-    signal *= 10000
-    offset = int(signal[:7])
-    signal = [int(c) for c in signal]
-    signal = signal[offset:]
+    signal = utils.get_digit_grid()[0]
+    offset = int(''.join(str(digit) for digit in signal[:7]))
+    signal = np.tile(signal, 10000)[offset:]
 
-    for i in range(100):
+    for _ in range(100):
         # The offset is > half of the entire signal, meaning that we just need to
         # generate cumulative sums for the digits, since for offset > n / 2, every
         # digit's pattern is either 0 if it's below the offset and 1 if it's at or greater
@@ -60,6 +58,5 @@ def part_2():
         # O(n log n) complexity for each phase.
         signal = (np.cumsum(signal[::-1]) % 10)[::-1]
         # signal = interpolate(signal, offset=offset)
-        print(i)
 
-    print(''.join(str(digit) for digit in signal[:8]))
+    return ''.join(str(digit) for digit in signal[:8])
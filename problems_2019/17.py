@@ -74,7 +74,7 @@ def part_1():
         if all(neighbor in view.scaffolds for neighbor in scaffold.neighbors()):
             alignment += get_alignment(scaffold)
 
-    print(alignment)
+    return alignment
 
 
 @utils.part
@@ -105,4 +105,4 @@ def part_2():
     view = get_view(program)
     view.display()
 
-    print(output)
+    return output
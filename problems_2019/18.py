@@ -4,11 +4,12 @@ import heapq
 import string
 
 import cachetools
-import networkx as nx
-import numpy as np
 
 import utils
 
+np = utils.lazy_import('numpy')
+nx = utils.lazy_import('networkx')
+
 VECTORS = [
     np.array([0, 1]),
     np.array([0, -1]),
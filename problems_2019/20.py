@@ -2,14 +2,13 @@ import collections
 import itertools
 import string
 
-import networkx as nx
-
-from boltons import iterutils
-
 from utils import Vector
 
 import utils
 
+iterutils = utils.lazy_import('boltons.iterutils')
+nx = utils.lazy_import('networkx')
+
 
 VECTORS = [
     Vector(0, 1, 0),
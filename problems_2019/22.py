@@ -2,10 +2,10 @@ import functools
 import itertools
 import re
 
-from sympy.core import numbers
-
 import utils
 
+numbers = utils.lazy_import('sympy.core.numbers')
+
 
 REVERSE_RE = r'deal into new stack'
 CUT_RE = r'cut (-?\d+)'
@@ -1,9 +1,9 @@
 import enum
 
-import numpy as np
-
 import utils
 
+np = utils.lazy_import('numpy')
+
 
 class Direction(enum.Enum):
     UP = 'U'
@@ -1,7 +1,7 @@
-import networkx as nx
-
 import utils
 
+nx = utils.lazy_import('networkx')
+
 
 def get_graph():
     edges = utils.get_input(delimiter=')', cast=str)
@@ -1,9 +1,9 @@
 import re
 
-import numpy as np
-
 import utils
 
+np = utils.lazy_import('numpy')
+
 
 INSTRUCTION_REGEX = r'(?P<action>[A-Z])(?P<value>\d+)'
 WAYPOINT_DELTA = np.array([
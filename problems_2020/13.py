@@ -1,9 +1,9 @@
 import math
 
-from sympy.ntheory.modular import crt
-
 import utils
 
+modular = utils.lazy_import('sympy.ntheory.modular')
+
 
 def min_departure(min_timestamp, bus):
     return bus * math.ceil(min_timestamp / bus)
@@ -31,4 +31,4 @@ def part_2():
         if bus != 'x'
     ])
 
-    print(crt(buses, offsets)[0])
+    print(modular.crt(buses, offsets)[0])
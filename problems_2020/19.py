@@ -1,10 +1,11 @@
 import re
 
-import networkx as nx
 import regex
 
 import utils
 
+nx = utils.lazy_import('networkx')
+
 
 def add_rule(graph, rule, skip=None):
     number, rule = rule.split(':')
@@ -5,15 +5,14 @@ import re
 
 from dataclasses import dataclass
 
-import networkx as nx
-import numpy as np
-
-from boltons import iterutils
-
 from utils import Vector
 
 import utils
 
+iterutils = utils.lazy_import('boltons.iterutils')
+np = utils.lazy_import('numpy')
+nx = utils.lazy_import('networkx')
+
 
 EDGE_TO_VECTOR = {
     0: Vector(0, -1),  # left
@@ -33,7 +32,7 @@ SEA_MONSTER_SIZE = sum(regex.count('#') for regex in SEA_MONSTER_REGEXES)
 @dataclass
 class Tile:
     id: int
-    points: np.ndarray
+    points: 'np.ndarray'
 
     def edges(self):
         edges = [
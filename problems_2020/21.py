@@ -4,12 +4,11 @@ import typing
 
 from dataclasses import dataclass
 
-import z3
-
-from boltons import iterutils
-
 import utils
 
+iterutils = utils.lazy_import('boltons.iterutils')
+z3 = utils.lazy_import('z3')
+
 
 @dataclass(frozen=True)
 class Food:
@@ -1,7 +1,7 @@
-from boltons import iterutils
-
 import utils
 
+iterutils = utils.lazy_import('boltons.iterutils')
+
 
 class Cups:
     def __init__(self, cups):
@@ -63,14 +63,21 @@ class Node:
         self.next = None
 
 
-def play(cups, rounds):
+def play(cups, rounds, checkpoint=None):
+    # The cups are checkpointed as their values in order starting from the current cup, since the linked list
+    # itself is too deeply nested to pickle.
+    first_round, cups = checkpoint.load(default=(0, cups)) if checkpoint else (0, cups)
+
     starting_cup = cups[0]
     cups = Cups(cups)
     node = cups[starting_cup]
     min_cup = min(cups)
     max_cup = max(cups)
 
-    for _ in range(rounds):
+    for i in range(first_round, rounds):
+        if checkpoint and checkpoint.due():
+            checkpoint.save((i, cups.values(node.value)))
+
         removed_nodes = node.next, node.next.next, node.next.next.next
         removed_cups = [node.value for node in removed_nodes]
         cups.remove(removed_nodes)
@@ -95,6 +102,9 @@ def play(cups, rounds):
         cups.insert(destination, removed_nodes)
         node = node.next
 
+    if checkpoint:
+        checkpoint.clear()
+
     return cups
 
 
@@ -109,6 +119,6 @@ def part_1():
 def part_2():
     cups = utils.get_input(delimiter='')[0]
     cups += list(range(max(cups) + 1, 1_000_001))
-    cups = play(cups, 10_000_000)
+    cups = play(cups, 10_000_000, checkpoint=utils.checkpoint('part_2'))
     cup_1, cup_2 = cups.values(1)[1:3]
     print(cup_1 * cup_2)
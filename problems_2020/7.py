@@ -1,10 +1,11 @@
 import re
 
 import cachetools
-import networkx as nx
 
 import utils
 
+nx = utils.lazy_import('networkx')
+
 BAG_REGEX = r'(?P<color>[a-z]+ [a-z]+) bags?'
 WEIGHT_REGEX = rf'(?P<weight>\d+) {BAG_REGEX}'
 EMPTY = 'no other bags'
@@ -1,51 +1,45 @@
 import utils
 
+np = utils.lazy_import('numpy')
 
-def run_step(grid):
-    flashed = set()
-
-    for point in grid:
-        grid[point] += 1
-
-    flashing = set(point for point, value in grid.items() if value > 9)
-
-    while flashing:
-        point = flashing.pop()
-
-        for neighbor in grid.neighbors(point):
-            grid[neighbor] += 1
-            if grid[neighbor] > 9 and neighbor not in flashed:
-                flashing.add(neighbor)
-
-        flashed.add(point)
-
-    for point in flashed:
-        grid[point] = 0
 
+def run_step(grid):
+    grid.array += 1
+    flashed = np.zeros(grid.array.shape, dtype=bool)
+    flashing = grid.array > 9
+
+    # Every octopus that flashes raises its neighbors' energy at the same time, so the flashes spread out in
+    # waves rather than one at a time.
+    while flashing.any():
+        flashed |= flashing
+        grid.array += grid.count_neighbors(flashing)
+        flashing = (grid.array > 9) & ~flashed
+
+    grid[flashed] = 0
     return flashed
 
 
 @utils.part
 def part_1():
-    grid = utils.get_grid(grid_cls=utils.DiagonalGrid, delimiter='')
+    grid = utils.get_grid(grid_cls=utils.DiagonalDenseGrid, delimiter='', parse_graph=False)
     flash_count = 0
 
     for _ in range(100):
         flashed = run_step(grid)
-        flash_count += len(flashed)
+        flash_count += flashed.sum()
 
     print(flash_count)
 
 
 @utils.part
 def part_2():
-    grid = utils.get_grid(grid_cls=utils.DiagonalGrid, delimiter='')
+    grid = utils.get_grid(grid_cls=utils.DiagonalDenseGrid, delimiter='', parse_graph=False)
     step = 0
 
     while True:
         step += 1
         flashed = run_step(grid)
 
-        if len(flashed) == len(grid):
+        if flashed.all():
             print(step)
             break
@@ -1,7 +1,7 @@
-import networkx as nx
-
 import utils
 
+nx = utils.lazy_import('networkx')
+
 
 def path_count(graph, start, visited, can_visit_dupe):
     visited = visited | {start}
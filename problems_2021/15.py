@@ -1,17 +1,13 @@
-import networkx as nx
-import numpy as np
-
 import utils
+from utils import paths
+
+np = utils.lazy_import('numpy')
 
 
 def get_lowest_risk_path(grid):
     start = (0, 0)
     end = (grid.rows - 1, grid.columns - 1)
-
-    for u, v in grid.graph.edges():
-        grid.graph.edges[u, v]['risk'] = grid[v]
-
-    return nx.dijkstra_path_length(grid.graph, start, end, weight='risk')
+    return paths.grid_dijkstra(grid.array, [start], end)[end]
 
 
 def expand_map(points):
@@ -27,11 +23,11 @@ def expand_map(points):
 
 @utils.part
 def part_1():
-    grid = utils.get_grid(grid_cls=utils.DirectedGrid, delimiter='')
+    grid = utils.get_grid(grid_cls=utils.DenseGrid, delimiter='', parse_graph=False)
     print(get_lowest_risk_path(grid))
 
 
 @utils.part
 def part_2():
-    grid = utils.get_grid(input_transformer=expand_map, grid_cls=utils.DirectedGrid, delimiter='')
+    grid = utils.get_grid(input_transformer=expand_map, grid_cls=utils.DenseGrid, delimiter='', parse_graph=False)
     print(get_lowest_risk_path(grid))
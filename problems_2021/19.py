@@ -2,17 +2,17 @@ import dataclasses
 import itertools
 import typing
 
-import numpy as np
-
-from utils import Vector
+from utils import Vector3D
 
 import utils
 
+np = utils.lazy_import('numpy')
+
 
 @dataclasses.dataclass(frozen=True)
 class Scanner:
     id: int
-    points: typing.FrozenSet[Vector]
+    points: typing.FrozenSet[Vector3D]
 
     def __iter__(self):
         return iter(self.points)
@@ -33,11 +33,13 @@ def rotated_match(scanner_1, scanner_2):
 
 def match(scanner_1, scanner_2):
     for rotation in utils.ROTATIONS_3D:
-        rotated_scanner_2 = Scanner(
-            scanner_2.id,
-            frozenset(Vector(np.dot(rotation, point)) for point in scanner_2),
-        )
-        result = rotated_match(scanner_1, rotated_scanner_2)
+        with utils.span('rotate'):
+            rotated_scanner_2 = Scanner(
+                scanner_2.id,
+                frozenset(Vector3D(np.dot(rotation, point)) for point in scanner_2),
+            )
+        with utils.span('rotated_match'):
+            result = rotated_match(scanner_1, rotated_scanner_2)
         if result:
             return result
 
@@ -45,16 +47,22 @@ def match(scanner_1, scanner_2):
 
 
 def orient_one(oriented, unlocated, positions, cache):
+    attempts = utils.counter('match attempts')
+    skipped = utils.counter('match cache hits')
+    matches = utils.counter('matches')
+
     for scanner_2 in unlocated:
         for scanner_1 in oriented:
             if (scanner_2.id, scanner_1.id) in cache:
+                skipped.incr()
                 continue
 
-            print(f'Matching {scanner_2.id} to {scanner_1.id}')
-            result = match(scanner_1, scanner_2)
+            attempts.incr()
+            with utils.span('match'):
+                result = match(scanner_1, scanner_2)
             if result:
                 oriented_scanner_2, position = result
-                print(f'MATCH: {position}')
+                matches.incr()
 
                 oriented.append(oriented_scanner_2)
                 positions.append(position)
@@ -67,7 +75,7 @@ def orient_one(oriented, unlocated, positions, cache):
 
 def orient(scanners):
     oriented, unlocated = scanners[:1], set(scanners[1:])
-    positions = [Vector(0, 0, 0)]
+    positions = [Vector3D(0, 0, 0)]
     cache = set()
 
     while unlocated:
@@ -84,7 +92,7 @@ def get_scanners():
         scanners.append(Scanner(
             i,
             frozenset(
-                Vector(utils.parse(coordinate)[0])
+                Vector3D(utils.parse(coordinate)[0])
                 for coordinate in coordinates
             )
         ))
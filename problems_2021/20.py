@@ -1,9 +1,8 @@
-from scipy import signal
-
-import numpy as np
-
 import utils
 
+np = utils.lazy_import('numpy')
+signal = utils.lazy_import('scipy.signal')
+
 
 KERNEL = np.reshape(2 ** np.arange(9), (3, 3))
 
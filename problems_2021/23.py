@@ -2,10 +2,10 @@ import dataclasses
 import heapq
 import typing
 
-import numpy as np
-
 import utils
 
+np = utils.lazy_import('numpy')
+
 
 A, B, C, D = 10 ** np.arange(4)
 
@@ -1,9 +1,9 @@
 import itertools
 
-import z3
-
 import utils
 
+z3 = utils.lazy_import('z3')
+
 
 # Rules determined by manually inspecting the logic of the given program.
 # Note that each section after an `inp w` tends to follow one of two patterns.
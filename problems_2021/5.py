@@ -29,7 +29,7 @@ def get_intersections(straight_only=False):
             tuple(int(val) for val in end.split(',')),
         )
         for begin, end in
-        utils.get_input(delimiter=' -> ', cast=str)
+        utils.get_input(delimiter=' -> ', cast=str, stream=True)
     ]
 
     if straight_only:
@@ -1,10 +1,10 @@
 import collections
 import math
 
-import networkx as nx
-
 import utils
 
+nx = utils.lazy_import('networkx')
+
 
 def get_low_points(grid):
     for point, value in grid.items():
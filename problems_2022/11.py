@@ -3,10 +3,10 @@ from typing import Callable
 import dataclasses
 import math
 
-import parse
-
 import utils
 
+parse = utils.lazy_import('parse')
+
 
 @dataclasses.dataclass
 class Monkey:
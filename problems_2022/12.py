@@ -1,9 +1,12 @@
 import collections
+import functools
 import string
 
-import networkx as nx
-
 import utils
+from utils import paths
+
+np = utils.lazy_import('numpy')
+nx = utils.lazy_import('networkx')
 
 
 HEIGHTS = {
@@ -14,17 +17,22 @@ HEIGHTS = {
 
 
 class ElevationGrid(utils.Grid):
+    @functools.cached_property
+    def start(self):
+        point, _ = utils.assert_one(self.items(), key=lambda item: item[1] == 'S')
+        return point
+
+    @functools.cached_property
+    def end(self):
+        point, _ = utils.assert_one(self.items(), key=lambda item: item[1] == 'E')
+        return point
+
     def to_graph(self):
         graph = nx.DiGraph()
         for point, value in self.points.items():
             graph.add_node(point, value=value, height=HEIGHTS[value])
 
         for point in self.points:
-            if self.points[point] == 'S':
-                self.start = point
-            elif self.points[point] == 'E':
-                self.end = point
-
             for neighbor in point.neighbors():
                 if neighbor in self.points:
                     if graph.nodes[neighbor]['height'] <= graph.nodes[point]['height'] + 1:
@@ -107,3 +115,24 @@ def shortest_paths_from_end(grid):
 def part_2_bfs_reverse():
     grid = utils.get_grid(cast=str, delimiter='', parse_graph=False)
     print(shortest_paths_from_end(grid))
+
+
+def get_csr_graph(grid):
+    heights = utils.DenseGrid(np.vectorize(HEIGHTS.get)(grid.array), parse_graph=False)
+    return heights.to_csr(is_edge=lambda source, target: target <= source + 1)
+
+
+@utils.part
+def part_1_csr():
+    grid = utils.get_grid(grid_cls=utils.DenseGrid, cast=str, delimiter='', parse_graph=False)
+    values = grid.array.ravel()
+    end = np.flatnonzero(values == 'E')[0]
+    print(paths.bfs(get_csr_graph(grid), np.flatnonzero(values == 'S'), end)[end])
+
+
+@utils.part
+def part_2_csr():
+    grid = utils.get_grid(grid_cls=utils.DenseGrid, cast=str, delimiter='', parse_graph=False)
+    values = grid.array.ravel()
+    end = np.flatnonzero(values == 'E')[0]
+    print(paths.bfs(get_csr_graph(grid), np.flatnonzero(np.isin(values, ['S', 'a'])), end)[end])
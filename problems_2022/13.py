@@ -2,10 +2,10 @@ import ast
 import functools
 import itertools
 
-from boltons import iterutils
-
 import utils
 
+iterutils = utils.lazy_import('boltons.iterutils')
+
 
 def get_packets():
     return utils.get_input(cast=ast.literal_eval, delimiter='\n', line_delimiter='\n\n')
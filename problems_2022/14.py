@@ -1,5 +1,3 @@
-import parse
-
 import utils
 
 
@@ -9,7 +7,7 @@ class StopException(Exception):
 
 def get_points():
     data = utils.get_input(
-        cast=lambda x: parse.parse('{:d},{:d}', x),
+        cast=lambda x: utils.parse_format('{:d},{:d}', x),
         delimiter=' -> ',
         line_delimiter='\n',
     )
@@ -1,21 +1,15 @@
 import itertools
 
-from boltons import iterutils
-
-import parse
-import z3
-
 from utils import Vector
 
 import utils
 
+iterutils = utils.lazy_import('boltons.iterutils')
+z3 = utils.lazy_import('z3')
+
 
 def get_data():
-    data = utils.get_input(
-        cast=lambda line: parse.parse('Sensor at x={:d}, y={:d}: closest beacon is at x={:d}, y={:d}', line),
-        delimiter=None,
-        line_delimiter='\n',
-    )
+    data = utils.get_input(format='Sensor at x={:d}, y={:d}: closest beacon is at x={:d}, y={:d}')
 
     points = []
 
@@ -89,8 +83,12 @@ def part_2_brute_force():
     excluded
     """
     data = get_data()
+    checkpoint = utils.checkpoint('part_2_brute_force')
+
+    for y in range(checkpoint.load(default=0), 4_000_001):
+        if checkpoint.due():
+            checkpoint.save(y)
 
-    for y in range(4_000_001):
         if y % 100000 == 0:
             print(f'Y: {y}')
 
@@ -108,6 +106,8 @@ def part_2_brute_force():
         print(tuning_frequency(distress_beacon))
         break
 
+    checkpoint.clear()
+
 
 def z3_abs(x):
     return z3.If(x >= 0, x, -x)
@@ -2,15 +2,15 @@ import collections
 import dataclasses
 import itertools
 
-import networkx as nx
-
-from utils import Vector
+from utils import Vector3D
 
 import utils
 
+nx = utils.lazy_import('networkx')
+
 
 def get_data():
-    return utils.get_input(cast=int, line_cast=Vector, delimiter=',', line_delimiter='\n')
+    return utils.get_input(cast=int, line_cast=Vector3D, delimiter=',', line_delimiter='\n')
 
 
 class Boundary:
@@ -124,13 +124,13 @@ def part_2_connected_components():
         range(boundary.min_y - 1, boundary.max_y + 2),
         range(boundary.min_z - 1, boundary.max_z + 2),
     ):
-        point = Vector(x, y, z)
+        point = Vector3D(x, y, z)
         for neighbor in point.neighbors():
             if point not in cubes and neighbor not in cubes:
                 graph.add_edge(point, neighbor)
 
     # This is guaranteed to be an exterior point since by definition it's not contained in the set of cubes
-    exterior_corner = Vector(boundary.min_x - 1, boundary.min_y - 1, boundary.min_z - 1)
+    exterior_corner = Vector3D(boundary.min_x - 1, boundary.min_y - 1, boundary.min_z - 1)
     exterior = set(nx.descendants(graph, exterior_corner))
 
     print(sum(
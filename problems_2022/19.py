@@ -1,23 +1,18 @@
 import collections
 import math
 
-import parse
-
 import utils
 
 
 def get_blueprints():
     return utils.get_input(
-        cast=lambda line: parse.parse(
+        format=(
             'Blueprint {:d}: '
             'Each ore robot costs {:d} ore. '
             'Each clay robot costs {:d} ore. '
             'Each obsidian robot costs {:d} ore and {:d} clay. '
-            'Each geode robot costs {:d} ore and {:d} obsidian.',
-            line,
+            'Each geode robot costs {:d} ore and {:d} obsidian.'
         ),
-        delimiter=None,
-        line_delimiter='\n',
     )
 
 
@@ -29,17 +24,18 @@ def get_max_geodes(blueprint, total_time):
     # (ore_robots, clay_robots, obsidian_robots, geode_robots, ore, clay, obsidian, geode, remaining time)
     initial = (1, 0, 0, 0, 0, 0, 0, 0, total_time)
 
-    queue = collections.deque([initial])
-    seen = set()
-    times = set()
-    max_geodes = 0
+    checkpoint = utils.checkpoint(f'blueprint_{blueprint_id}_{total_time}')
+    queue, seen, max_geodes = checkpoint.load(default=(collections.deque([initial]), set(), 0))
+
+    popped = utils.counter('states popped')
+    duplicates = utils.counter('duplicate states')
 
     while queue:
-        r_o, r_c, r_ob, r_g, o, c, ob, g, time = queue.popleft()
+        if checkpoint.due():
+            checkpoint.save((queue, seen, max_geodes))
 
-        if time not in times:
-            times.add(time)
-            print(f'[{blueprint_id}] Time left: {time:<2} | Queue size: {len(queue)}')
+        r_o, r_c, r_ob, r_g, o, c, ob, g, time = queue.popleft()
+        popped.incr()
 
         max_geodes = max(max_geodes, g)
 
@@ -60,6 +56,7 @@ def get_max_geodes(blueprint, total_time):
         state = (r_o, r_c, r_ob, r_g, o, c, ob, g, time)
 
         if state in seen:
+            duplicates.incr()
             continue
 
         seen.add(state)
@@ -88,6 +85,7 @@ def get_max_geodes(blueprint, total_time):
             r_o, r_c, r_ob, r_g, o + r_o, c + r_c, ob + r_ob, g + r_g, time - 1
         ))
 
+    checkpoint.clear()
     return max_geodes
 
 
@@ -1,12 +1,10 @@
 import operator
 
-import sympy
-import z3
-
 import utils
 
+sympy = utils.lazy_import('sympy')
+z3 = utils.lazy_import('z3')
 
-X = sympy.Symbol('x')
 
 OPS = {
     '+': operator.add,
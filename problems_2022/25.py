@@ -1,7 +1,7 @@
-import numpy as np
-
 import utils
 
+np = utils.lazy_import('numpy')
+
 
 DIGITS = {
     '0': 0,
@@ -1,9 +1,9 @@
 import string
 
-from boltons import iterutils
-
 import utils
 
+iterutils = utils.lazy_import('boltons.iterutils')
+
 
 PRIORITIES = {
     letter: i + 1
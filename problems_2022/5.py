@@ -1,10 +1,10 @@
 import dataclasses
 import re
 
-import parse
-
 import utils
 
+parse = utils.lazy_import('parse')
+
 
 @dataclasses.dataclass
 class Move:
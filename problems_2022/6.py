@@ -1,8 +1,9 @@
-from boltons import iterutils
 from cytoolz import itertoolz
 
 import utils
 
+iterutils = utils.lazy_import('boltons.iterutils')
+
 
 def get_signal():
     return utils.get_input(cast=str, delimiter='')[0]
@@ -2,10 +2,10 @@ from typing import List
 
 import dataclasses
 
-import parse
-
 import utils
 
+parse = utils.lazy_import('parse')
+
 
 @dataclasses.dataclass
 class File:
@@ -23,7 +23,7 @@ class Node:
 
 
 def get_tree():
-    data = utils.get_input(cast=str, delimiter='\n', line_delimiter='\n$ ', remove_prefix='$ ')
+    data = utils.get_input(cast=str, delimiter='\n', line_delimiter='\n$ ', remove_prefix='$ ', stream=True)
     root = Node('/', None)
     pointer = root
 
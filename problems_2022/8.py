@@ -1,10 +1,10 @@
-import numpy as np
-
 import utils
 
+np = utils.lazy_import('numpy')
+
 
 def get_data():
-    return np.array(utils.get_input(delimiter=''))
+    return utils.get_digit_grid()
 
 
 def is_visible(grid, i, j):
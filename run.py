@@ -1,84 +1,424 @@
 #!/usr/bin/env python
 
 import collections
+import contextlib
 import datetime
-import importlib
-import os
-import re
+import functools
+import io
+import itertools
+import json
+import sys
+import timeit
 
-import cachetools
 import click
 
 import utils
+from runner import (
+    batch, bench, cache, daemon, execution, isolation, manifest, memory, metrics, profiling, schedule, shootout,
+    startup,
+)
 
 
-@cachetools.cached({})
-def get_module(year, day):
-    return importlib.import_module(f'problems_{year}.{day}')
+def get_parts_by_day(year, problems):
+    available = manifest.get_parts(year)
+    parts_by_day = collections.defaultdict(set)
+
+    for problem in problems:
+        day, _, part_id = problem.partition('.')
+
+        if int(day) not in available:
+            raise click.ClickException(f'Day {day} of {year} has no solution module')
+
+        parts = available[int(day)]
+
+        if not part_id:
+            parts_by_day[int(day)] = set(parts)
+        elif part_id in parts:
+            parts_by_day[int(day)].add(part_id)
+        else:
+            raise click.ClickException(
+                f'Part {part_id} of problems_{year}.{day} is not registered. Registered parts: {parts}'
+            )
+
+    return parts_by_day
+
+
+def print_header(unit, previous, units):
+    if previous and (unit.year, unit.day) == (previous.year, previous.day):
+        return
+
+    if len({other.year for other in units}) > 1:
+        print(f'========== {unit.year} DAY {unit.day} ==========\n')
+    elif len({other.day for other in units}) > 1:
+        print(f'========== DAY {unit.day} ==========\n')
+
+
+def replay(result):
+    sys.stdout.write(result.output)
+    print(f'[cached, originally took {utils.format_elapsed(result.seconds)}]')
+
+
+def load_cached(unit, options):
+    # Profiles aren't cached, so profiling always re-runs the part.
+    if not options.use_cache or options.refresh or options.profiling:
+        return None
+    return cache.load(unit)
+
+
+def finish(unit, result, options):
+    if result.status != execution.OK:
+        print(f'[{result.status} after {utils.format_elapsed(result.seconds)}]')
+        return
+
+    if result.memory:
+        print(memory.format_report(result.memory))
+
+    # Profiling slows parts down, so their timings aren't worth caching.
+    if options.use_cache and not options.profiling:
+        cache.store(unit, result)
+
 
+def format_json(unit, result, cached, input_path=None):
+    return json.dumps({
+        **({'input': str(input_path)} if input_path else {}),
+        'year': unit.year,
+        'day': unit.day,
+        'part': unit.part_id,
+        'answer': result.answer,
+        'seconds': result.seconds,
+        'peak_mb': round(result.peak_rss / 2 ** 20, 1) if result.peak_rss is not None else None,
+        'status': result.status,
+        'cached': cached,
+    })
 
-def get_all_available_days(year):
+
+def run_part(unit, settings, options):
+    if options.isolated:
+        return isolation.run_isolated(
+            unit,
+            settings,
+            timeout=options.timeout,
+            max_rss=options.max_rss,
+            stream=sys.stdout,
+            profile_memory=options.profile_memory,
+        )
+    return execution.run_captured(unit, stream=sys.stdout, profile_memory=options.profile_memory)
+
+
+def execute_serial(units, settings, options, json_stream=None):
+    results = {}
+    previous = None
+
+    for unit in units:
+        print_header(unit, previous, units)
+        previous = unit
+        print(f'--- PART {unit.part_id} ---')
+
+        cached = load_cached(unit, options)
+        if cached:
+            replay(cached)
+        else:
+            results[unit] = run_part(unit, settings, options)
+            finish(unit, results[unit], options)
+
+        if json_stream:
+            print(format_json(unit, cached or results[unit], bool(cached)), file=json_stream, flush=True)
+
+        print()
+
+    return results
+
+
+def get_units(year, parts_by_day):
     return [
-        file.removesuffix('.py')
-        for file in os.listdir(f'problems_{year}')
-        if re.match(r'\d+\.py', file)
+        execution.Unit(year, day, part_id)
+        for day, part_ids in sorted(parts_by_day.items())
+        for part_id in sorted(part_ids)
     ]
 
 
-def get_parts_by_day(year, problems):
-    parts_by_day = collections.defaultdict(set)
+def execute_parallel(units, jobs, settings, options, json_stream=None):
+    cached = {unit: load_cached(unit, options) for unit in units}
+    pending = [unit for unit in units if not cached[unit]]
+    order = schedule.order(pending, schedule.load_history())
 
-    for problem in problems:
-        if '.' in problem:
-            day, part_id = problem.split('.', maxsplit=1)
+    if options.isolated:
+        results = isolation.run_parallel(
+            pending,
+            jobs,
+            settings,
+            timeout=options.timeout,
+            max_rss=options.max_rss,
+            profile_memory=options.profile_memory,
+            order=order,
+        )
+    else:
+        results = execution.run_parallel(pending, jobs, settings, profile_memory=options.profile_memory, order=order)
 
-            module = get_module(year, day)
-            parts = utils.PART_REGISTRY[module.__name__]
-            part = parts.get(part_id)
+    finished = {}
+    previous = None
 
-            if not part:
-                raise click.ClickException(
-                    f'Part {part_id} of {module} is not registered. Registered parts: {list(parts.keys())}'
-                )
+    for unit in units:
+        print_header(unit, previous, units)
+        previous = unit
+        print(f'--- PART {unit.part_id} ---')
 
-            parts_by_day[int(day)].add(part)
+        if cached[unit]:
+            replay(cached[unit])
         else:
-            day = problem
-            module = get_module(year, day)
-            parts_by_day[int(day)] = set(utils.PART_REGISTRY[module.__name__].values())
+            _, result = next(results)
+            sys.stdout.write(result.output)
+            finished[unit] = result
+            finish(unit, result, options)
 
-    return parts_by_day
+        if json_stream:
+            print(format_json(unit, cached[unit] or finished[unit], bool(cached[unit])), file=json_stream, flush=True)
+
+        print()
+
+    return finished
+
+
+def report(results, elapsed, jobs, options, summarize):
+    # Profiled runs are slower than usual, so they'd throw off the schedule of later runs.
+    if results and not options.profiling:
+        schedule.record(results)
+
+    if results and summarize:
+        print(schedule.format_summary(results, elapsed, jobs))
 
+    failed = [unit for unit, result in results.items() if result.status != execution.OK]
+    for unit in failed:
+        print(f'DID NOT FINISH: {unit.year}/{unit.day} part {unit.part_id}')
 
-def execute_day(parts):
-    for part in sorted(parts, key=lambda part: part.id):
-        print(f'--- PART {part.id} ---')
-        part.cmd()
+    if failed:
+        raise click.ClickException(f'{len(failed)} part(s) did not finish')
+
+
+def execute_batch(units, inputs_dir, jobs, settings, json_stream=None):
+    if len({(unit.year, unit.day) for unit in units}) != 1:
+        raise click.ClickException('--inputs-dir runs the parts of exactly one day')
+
+    input_paths = batch.get_input_paths(inputs_dir)
+    results = {}
+
+    for task, result in batch.run(units, input_paths, jobs, settings):
+        results[task] = result
+        if json_stream:
+            print(format_json(task.unit, result, False, task.input_path), file=json_stream, flush=True)
+
+    print(batch.format_table(units, results, input_paths))
+
+    failed = [task for task, result in results.items() if result.status != execution.OK]
+    for task in failed:
+        print(f'\nFAILED: part {task.unit.part_id} on {task.input_path.name}\n{results[task].output}')
+
+    if failed:
+        raise click.ClickException(f'{len(failed)} run(s) failed')
+
+
+# pylint: disable=too-many-arguments
+def execute_bench(units, repeat, warmup, output, baseline, threshold, options):
+    # The profilers would otherwise run inside every timed repetition.
+    if options.profile_calls:
+        raise click.ClickException('--cprofile and --sample are not supported with --bench')
+
+    results = {}
+
+    for unit in units:
+        cmd = execution.get_part(unit).cmd
+        stats = bench.benchmark(cmd, repeat, warmup)
+        results[unit] = stats
+        print(bench.format_stats(unit, stats))
+
+        # Memory is profiled in a separate run, since tracing allocations slows the part down.
+        if options.profile_memory:
+            with contextlib.redirect_stdout(io.StringIO()):
+                stats.memory = memory.profile(cmd)
+            print(memory.format_report(stats.memory))
+
+        # Likewise, counters and spans are recorded in a separate run so that they don't skew the timings.
+        if options.collect_metrics:
+            with contextlib.redirect_stdout(io.StringIO()):
+                stats.metrics = metrics.profile(cmd)
+            print(metrics.format_report(stats.metrics))
+
+    bench.save(results, output)
+    print(f'\nResults written to {output}')
+
+    if baseline:
+        regressions = bench.compare(results, bench.load(baseline), threshold)
+
+        for unit, ratio in regressions:
+            print(f'SLOWER: {unit.year}/{unit.day} part {unit.part_id} is {ratio:.2f}x the baseline median')
+
+        if regressions:
+            raise click.ClickException(f'{len(regressions)} part(s) got slower than {baseline}')
+
+
+def get_hooks(cprofile_dir, cprofile_top, sample_dir, sample_interval, collect_metrics):
+    hooks = []
+    if cprofile_dir:
+        hooks.append(functools.partial(profiling.cprofile, cprofile_dir, cprofile_top))
+    if sample_dir:
+        hooks.append(functools.partial(profiling.sample, sample_dir, sample_interval))
+    if collect_metrics:
+        hooks.append(metrics.hook)
+    return hooks
+
+
+def get_years(year, years_range):
+    try:
+        return schedule.parse_years(years_range) if years_range else [year]
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+
+def run_shootout(year, day, has_problems, repeat, warmup):
+    if has_problems:
+        raise click.ClickException('Cannot both specify problems and have --shootout enabled')
+
+    units = get_units(year, get_parts_by_day(year, [str(day)]))
+    if not shootout.run(units, repeat, warmup):
+        raise click.ClickException('Variants of some parts disagree on their answers')
+
+
+def run_startup_report(year, problems, run_all):
+    days = manifest.get_parts(year) if run_all else {int(problem.split('.')[0]) for problem in problems}
+
+    for day in sorted(days):
+        print(startup.format_report(year, day, startup.measure(year, day)))
         print()
 
 
+def get_units_for_years(years, problems, run_all, list_parts):
+    if run_all and problems:
+        raise click.ClickException('Cannot both specify problems and have -a/-all enabled')
+
+    problems_by_year = {
+        each_year: (
+            [str(day) for day in manifest.get_parts(each_year)]
+            if run_all or (list_parts and not problems)
+            else problems
+        )
+        for each_year in years
+    }
+
+    return [
+        unit
+        for each_year, year_problems in problems_by_year.items()
+        for unit in get_units(each_year, get_parts_by_day(each_year, year_problems))
+    ]
+
+
+def print_parts(units):
+    for (unit_year, day), day_units in itertools.groupby(units, key=lambda unit: (unit.year, unit.day)):
+        print(f'{unit_year}/{day}: {", ".join(unit.part_id for unit in day_units)}')
+
+
 @click.command()
 @click.argument('problems', nargs=-1)
 @click.option('-y', '--year', nargs=1, type=int, default=datetime.datetime.now().year, show_default=True)
+@click.option('--years', 'years_range')
 @click.option('-t', '--test', is_flag=True, default=False)
 @click.option('-p', '--profile', is_flag=True, default=False)
 @click.option('-a', '--all', 'run_all', is_flag=True, default=False)
-def cli(problems, year, test, profile, run_all):
-    utils.IS_TEST = test
-    utils.IS_TIMED = profile
+@click.option('-j', '--jobs', type=click.IntRange(min=1), default=1, show_default=True)
+@click.option('--bench', 'run_bench', is_flag=True, default=False)
+@click.option('--repeat', type=click.IntRange(min=1), default=5, show_default=True)
+@click.option('--warmup', type=click.IntRange(min=0), default=1, show_default=True)
+@click.option('--bench-output', type=click.Path(dir_okay=False), default='bench.json', show_default=True)
+@click.option('--compare', 'baseline', type=click.Path(exists=True, dir_okay=False))
+@click.option('--threshold', type=float, default=0.1, show_default=True)
+@click.option('--no-cache', 'use_cache', is_flag=True, flag_value=False, default=True)
+@click.option('--refresh', is_flag=True, default=False)
+@click.option('--startup-report', is_flag=True, default=False)
+@click.option('--list', 'list_parts', is_flag=True, default=False)
+@click.option('--input-cache', is_flag=True, default=False)
+@click.option('--shootout', 'shootout_day', type=int)
+@click.option('--memory', 'profile_memory', is_flag=True, default=False)
+@click.option('--metrics', 'collect_metrics', is_flag=True, default=False)
+@click.option('--cprofile', 'cprofile_dir', type=click.Path(file_okay=False))
+@click.option('--cprofile-top', type=click.IntRange(min=1), default=20, show_default=True)
+@click.option('--sample', 'sample_dir', type=click.Path(file_okay=False))
+@click.option('--sample-interval', type=click.FloatRange(min=0, min_open=True), default=0.005, show_default=True)
+@click.option('--timeout', type=click.FloatRange(min=0, min_open=True))
+@click.option('--max-rss', type=click.IntRange(min=1))
+@click.option('--serve', is_flag=True, default=False)
+@click.option('--resume', is_flag=True, default=False)
+@click.option('--inputs-dir', type=click.Path(exists=True, file_okay=False))
+@click.option('--format', 'output_format', type=click.Choice(['text', 'json']), default='text', show_default=True)
+# pylint: disable=too-many-arguments,too-many-locals
+def cli(
+    problems, year, years_range, test, profile, run_all, jobs, run_bench, repeat, warmup, bench_output, baseline,
+    threshold, use_cache, refresh, startup_report, list_parts, input_cache, shootout_day, profile_memory,
+    collect_metrics, cprofile_dir, cprofile_top, sample_dir, sample_interval, timeout, max_rss, serve, output_format,
+    inputs_dir, resume,
+):
+    if serve:
+        if problems or run_all:
+            raise click.ClickException('Cannot both specify problems and have --serve enabled')
+        daemon.serve(cli)
+        return
+
+    hooks = get_hooks(cprofile_dir, cprofile_top, sample_dir, sample_interval, collect_metrics and not run_bench)
+    settings = {
+        'IS_TEST': test,
+        'IS_TIMED': profile,
+        'CACHE_INPUTS_ON_DISK': input_cache,
+        'PART_HOOKS': hooks,
+        'RESUME': resume,
+    }
+    execution.configure(settings)
+    options = execution.Options(
+        use_cache=use_cache,
+        refresh=refresh,
+        profile_memory=profile_memory,
+        profile_calls=bool(hooks),
+        collect_metrics=collect_metrics,
+        timeout=timeout,
+        max_rss=max_rss * 1024 * 1024 if max_rss else None,
+    )
+
+    years = get_years(year, years_range)
+
+    if shootout_day is not None or startup_report:
+        if len(years) > 1:
+            raise click.ClickException('--shootout and --startup-report only support a single year')
+        if shootout_day is not None:
+            run_shootout(years[0], shootout_day, problems or run_all, repeat, warmup)
+        else:
+            run_startup_report(years[0], problems, run_all)
+        return
+
+    units = get_units_for_years(years, problems, run_all, list_parts)
+    if list_parts:
+        print_parts(units)
+        return
+
+    if (run_bench or inputs_dir) and options.isolated:
+        raise click.ClickException('--timeout and --max-rss are not supported with --bench or --inputs-dir')
 
-    if run_all:
-        if problems:
-            raise click.ClickException('Cannot both specify problems and have -a/-all enabled')
-        problems = get_all_available_days(year)
+    if run_bench:
+        execute_bench(units, repeat, warmup, bench_output, baseline, threshold, options)
+        return
 
-    parts_by_day = get_parts_by_day(year, problems)
+    # With --format json, only the results are written to stdout, as one JSON object per line, while the usual
+    # output goes to stderr instead.
+    json_stream = sys.stdout if output_format == 'json' else None
+    start = timeit.default_timer()
 
-    for day, parts in sorted(parts_by_day.items()):
-        if len(parts_by_day) > 1:
-            print(f'========== DAY {day} ==========\n')
+    with contextlib.redirect_stdout(sys.stderr) if json_stream else contextlib.nullcontext():
+        if inputs_dir:
+            execute_batch(units, inputs_dir, jobs, settings, json_stream)
+            return
+
+        if jobs > 1:
+            results = execute_parallel(units, jobs, settings, options, json_stream)
+        else:
+            results = execute_serial(units, settings, options, json_stream)
 
-        execute_day(parts)
+        report(results, timeit.default_timer() - start, jobs, options, summarize=run_all or len(years) > 1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,76 @@
+import concurrent.futures
+import pathlib
+import traceback
+import typing
+
+import utils
+from runner import execution
+
+
+class Task(typing.NamedTuple):
+    unit: execution.Unit
+    input_path: pathlib.Path
+
+
+def get_input_paths(directory: str) -> typing.List[pathlib.Path]:
+    return sorted(
+        path
+        for path in pathlib.Path(directory).iterdir()
+        if path.is_file() and not path.name.startswith('.')
+    )
+
+
+def run_task(task: Task) -> execution.Result:
+    # A part failing on one input shouldn't stop the others from running, so errors are recorded rather than
+    # raised.
+    try:
+        with utils.using_input(task.input_path):
+            return execution.run_captured(task.unit)
+    except Exception:  # pylint: disable=broad-except
+        return execution.Result(traceback.format_exc(), 0, status=execution.ERROR)
+
+
+def run(
+    units: typing.List[execution.Unit],
+    input_paths: typing.List[pathlib.Path],
+    jobs: int,
+    settings: typing.Dict[str, typing.Any],
+):
+    # Yields the result of every part for every input, in order of input and then part. Each worker keeps the
+    # modules it imported, so a day is only imported once per worker, however many inputs it runs.
+    tasks = [Task(unit, path) for path in input_paths for unit in units]
+
+    if jobs == 1:
+        yield from ((task, run_task(task)) for task in tasks)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=execution.configure,
+        initargs=(settings,),
+    ) as executor:
+        yield from zip(tasks, executor.map(run_task, tasks))
+
+
+def format_answer(result: execution.Result) -> str:
+    if result.status != execution.OK:
+        return result.status
+    return result.answer or ''
+
+
+def format_table(
+    units: typing.List[execution.Unit],
+    results: typing.Dict[Task, execution.Result],
+    input_paths: typing.List[pathlib.Path],
+) -> str:
+    rows = [['input', *[f'part {unit.part_id}' for unit in units]]]
+    rows.extend(
+        [path.name, *[format_answer(results[Task(unit, path)]) for unit in units]]
+        for path in input_paths
+    )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return '\n'.join(
+        '  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
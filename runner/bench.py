@@ -0,0 +1,133 @@
+import contextlib
+import dataclasses
+import io
+import json
+import os
+import statistics
+import timeit
+import typing
+
+import utils
+from runner.memory import Report
+from runner.execution import Unit
+
+
+@dataclasses.dataclass
+class Stats:
+    runs: typing.List[float]
+    memory: typing.Optional[Report] = None
+    metrics: typing.Optional[typing.Any] = None
+
+    @property
+    def min(self):
+        return min(self.runs)
+
+    @property
+    def median(self):
+        return statistics.median(self.runs)
+
+    @property
+    def p95(self):
+        if len(self.runs) < 2:
+            return self.runs[0]
+        return statistics.quantiles(self.runs, n=20, method='inclusive')[-1]
+
+    @property
+    def stddev(self):
+        if len(self.runs) < 2:
+            return 0.0
+        return statistics.stdev(self.runs)
+
+    def to_dict(self):
+        data = {
+            'min': self.min,
+            'median': self.median,
+            'p95': self.p95,
+            'stddev': self.stddev,
+            'repeat': len(self.runs),
+            'runs': self.runs,
+        }
+
+        if self.memory:
+            data['memory'] = self.memory.to_dict()
+
+        if self.metrics:
+            data['metrics'] = self.metrics.to_dict()
+
+        return data
+
+
+def benchmark(cmd: typing.Callable, repeat: int, warmup: int) -> Stats:
+    runs = []
+
+    # Output is discarded, since the point is to time the part rather than to look at its answer.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            cmd()
+
+        # Parsed inputs are cached in memory, so the cache is emptied before each run for parsing to be timed too.
+        for _ in range(repeat):
+            utils.INPUT_CACHE.clear()
+            start = timeit.default_timer()
+            cmd()
+            runs.append(timeit.default_timer() - start)
+
+    return Stats(runs)
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1:
+        return f'{seconds * 1000:.2f}ms'
+    return f'{seconds:.3f}s'
+
+
+def format_stats(unit: Unit, stats: Stats) -> str:
+    return (
+        f'{unit.year}/{unit.day} part {unit.part_id}: '
+        f'min {format_seconds(stats.min)} | '
+        f'median {format_seconds(stats.median)} | '
+        f'p95 {format_seconds(stats.p95)} | '
+        f'stddev {format_seconds(stats.stddev)} '
+        f'(n={len(stats.runs)})'
+    )
+
+
+def load(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save(results: typing.Dict[Unit, Stats], path: str):
+    # Results for parts that weren't benchmarked this time are kept, so that a file can be built up
+    # over several invocations.
+    data = load(path) if os.path.exists(path) else {}
+
+    for unit, stats in results.items():
+        data.setdefault(str(unit.year), {}).setdefault(str(unit.day), {})[unit.part_id] = stats.to_dict()
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def lookup(data: dict, unit: Unit) -> typing.Optional[dict]:
+    return data.get(str(unit.year), {}).get(str(unit.day), {}).get(unit.part_id)
+
+
+def compare(
+    results: typing.Dict[Unit, Stats],
+    baseline: dict,
+    threshold: float,
+) -> typing.List[typing.Tuple[Unit, float]]:
+    regressions = []
+
+    for unit, stats in results.items():
+        # Parts too quick to time (with a median of 0) can't be compared against.
+        entry = lookup(baseline, unit)
+        if not entry or not entry['median']:
+            continue
+
+        ratio = stats.median / entry['median']
+        if ratio > 1 + threshold:
+            regressions.append((unit, ratio))
+
+    return regressions
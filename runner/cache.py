@@ -0,0 +1,98 @@
+import hashlib
+import json
+import pathlib
+import re
+import typing
+
+import utils
+from runner.execution import ROOT, Result, Unit, normalize_answer
+
+
+CACHE_DIR = ROOT / '.cache' / 'answers'
+
+LOCAL_IMPORT_PATTERN = re.compile(r'^from (problems_\d+) import (\w+)|^import (problems_\d+)\.(\w+)', re.MULTILINE)
+
+
+def get_source_path(year: int, day: int) -> pathlib.Path:
+    return ROOT / f'problems_{year}' / f'{day}.py'
+
+
+def get_local_imports(source: str) -> typing.List[pathlib.Path]:
+    paths = []
+
+    for match in LOCAL_IMPORT_PATTERN.finditer(source):
+        package = match.group(1) or match.group(3)
+        name = match.group(2) or match.group(4)
+        path = ROOT / package / f'{name}.py'
+
+        if path.exists():
+            paths.append(path)
+
+    return paths
+
+
+def get_utils_paths() -> typing.List[pathlib.Path]:
+    return sorted(pathlib.Path(utils.__file__).parent.glob('*.py'))
+
+
+def read_bytes(path: pathlib.Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return b''
+
+
+def get_key(unit: Unit) -> str:
+    source_path = get_source_path(unit.year, unit.day)
+    source = read_bytes(source_path)
+
+    digest = hashlib.sha256()
+    digest.update(f'{unit.part_id}:{utils.IS_TIMED}'.encode())
+
+    # Each chunk is hashed separately so that the boundaries between files are part of the key.
+    for chunk in [
+        read_bytes(utils.get_input_path(str(source_path))),
+        source,
+        *[read_bytes(path) for path in get_local_imports(source.decode())],
+        *[read_bytes(path) for path in get_utils_paths()],
+    ]:
+        digest.update(hashlib.sha256(chunk).digest())
+
+    return digest.hexdigest()
+
+
+def get_entry_path(unit: Unit) -> pathlib.Path:
+    return CACHE_DIR / str(unit.year) / str(unit.day) / f'{unit.part_id}.json'
+
+
+def load(unit: Unit) -> typing.Optional[Result]:
+    path = get_entry_path(unit)
+    if not path.exists():
+        return None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        entry = json.load(f)
+
+    if entry['key'] != get_key(unit):
+        return None
+
+    return Result(
+        entry['output'],
+        entry['seconds'],
+        answer=normalize_answer(entry.get('answer')),
+        peak_rss=entry.get('peak_rss'),
+    )
+
+
+def store(unit: Unit, result: Result):
+    path = get_entry_path(unit)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'key': get_key(unit),
+            'output': result.output,
+            'seconds': result.seconds,
+            'answer': result.answer,
+            'peak_rss': result.peak_rss,
+        }, f)
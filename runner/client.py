@@ -0,0 +1,36 @@
+import json
+import os
+import pathlib
+import socket
+import sys
+import typing
+
+# This module is imported by the thin client, so it should only ever depend on the standard library.
+
+SOCKET_PATH = pathlib.Path(__file__).resolve().parent.parent / '.cache' / 'daemon.sock'
+
+
+def connect(args: typing.List[str], path: pathlib.Path = SOCKET_PATH) -> int:
+    # Sends the arguments to the daemon started by `run.py --serve`, and prints its output as it arrives. Each
+    # message from the daemon is a JSON line holding either some output or, last of all, the exit code.
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            print(f'No daemon is listening on {path}; start one with ./run.py --serve', file=sys.stderr)
+            return 1
+
+        sock.sendall(json.dumps({'args': args, 'cwd': os.getcwd()}).encode() + b'\n')
+
+        with sock.makefile('r', encoding='utf-8') as f:
+            for line in f:
+                message = json.loads(line)
+                if 'exit' in message:
+                    return message['exit']
+
+                stream = sys.stderr if message['stream'] == 'stderr' else sys.stdout
+                stream.write(message['text'])
+                stream.flush()
+
+    print('The daemon closed the connection without finishing', file=sys.stderr)
+    return 1
@@ -0,0 +1,188 @@
+import contextlib
+import importlib
+import io
+import json
+import os
+import pathlib
+import socketserver
+import sys
+import threading
+import traceback
+import typing
+
+import click
+
+import utils
+from runner.cache import get_utils_paths
+from runner.client import SOCKET_PATH
+
+
+# Libraries that are slow to import and used across many days, which the daemon imports once up front.
+PRELOAD = [
+    'boltons.iterutils',
+    'humanize',
+    'networkx',
+    'numpy',
+    'parse',
+    'scipy.signal',
+    'sympy',
+    'z3',
+]
+
+
+class ClientStream(io.TextIOBase):
+    def __init__(self, wfile, name: str):
+        super().__init__()
+        self.wfile = wfile
+        self.name = name
+        self.lock = threading.Lock()
+
+    def write(self, text):
+        # Click checks whether a stream is binary by trying to write bytes to it.
+        if not isinstance(text, str):
+            raise TypeError(f'write() argument must be str, not {type(text).__name__}')
+        if text:
+            self.send({'stream': self.name, 'text': text})
+        return len(text)
+
+    def send(self, message: dict):
+        with self.lock:
+            self.wfile.write(json.dumps(message).encode() + b'\n')
+            self.wfile.flush()
+
+    def reconfigure(self, **kwargs):
+        # Every write is sent to the client straight away, so there's no buffering to configure.
+        pass
+
+
+def get_problem_modules() -> typing.Dict[str, typing.Any]:
+    return {
+        name: module
+        for name, module in list(sys.modules.items())
+        if name.startswith('problems_') and '.' in name and getattr(module, '__file__', None)
+    }
+
+
+def get_mtime(module) -> int:
+    try:
+        return os.stat(module.__file__).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def get_utils_mtimes() -> typing.Dict[pathlib.Path, int]:
+    return {path: path.stat().st_mtime_ns for path in get_utils_paths()}
+
+
+class Reloader:
+    def __init__(self):
+        self.mtimes = {}
+        self.is_timed = utils.IS_TIMED
+        self.utils_mtimes = get_utils_mtimes()
+
+    def record(self):
+        for name, module in get_problem_modules().items():
+            self.mtimes.setdefault(name, get_mtime(module))
+
+    def reload(self, is_timed: bool) -> typing.List[str]:
+        modules = get_problem_modules()
+        changed = {name for name, module in modules.items() if get_mtime(module) != self.mtimes.get(name)}
+
+        # Parts are only wrapped to be timed as they're registered, so switching -p on or off means every day has
+        # to be registered again.
+        if is_timed != self.is_timed:
+            changed = set(modules)
+            self.is_timed = is_timed
+
+        # Days may have copied names out of a changed helper module (e.g. problems_2019.intcode), so every day of
+        # the same year is reloaded along with it.
+        for name in list(changed):
+            package, _, day = name.rpartition('.')
+            if package and not day.isdigit():
+                changed |= {other for other in modules if other.startswith(f'{package}.')}
+
+        # Helper modules are reloaded before the days that use them.
+        for name in sorted(changed, key=lambda name: (name.rpartition('.')[2].isdigit(), name)):
+            utils.PART_REGISTRY.pop(name, None)
+            utils.IS_TIMED = is_timed
+            importlib.reload(modules[name])
+            self.mtimes[name] = get_mtime(modules[name])
+
+        return sorted(changed)
+
+    @property
+    def is_stale(self):
+        return get_utils_mtimes() != self.utils_mtimes
+
+
+class Handler(socketserver.StreamRequestHandler):
+    server: 'Server'
+
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        stdout = ClientStream(self.wfile, 'stdout')
+        stderr = ClientStream(self.wfile, 'stderr')
+
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = self.server.run(request['args'], request['cwd'])
+
+        stdout.send({'exit': code})
+
+
+class Server(socketserver.UnixStreamServer):
+    def __init__(self, path: pathlib.Path, command: click.Command):
+        self.command = command
+        self.reloader = Reloader()
+        super().__init__(str(path), Handler)
+
+    def run(self, args: typing.List[str], cwd: str) -> int:
+        os.chdir(cwd)
+        # Parts can't prompt for input, since the daemon's stdin isn't the client's.
+        sys.stdin = io.StringIO()
+
+        try:
+            with self.command.make_context('run.py', list(args)) as ctx:
+                if ctx.params['serve']:
+                    raise click.ClickException('This is already the daemon')
+
+                if self.reloader.is_stale:
+                    print('[daemon] utils has changed since the daemon started; restart it to pick that up')
+
+                for name in self.reloader.reload(ctx.params['profile']):
+                    print(f'[daemon] reloaded {name}')
+
+                self.command.invoke(ctx)
+        except click.ClickException as e:
+            e.show()
+            return e.exit_code
+        except click.exceptions.Exit as e:
+            return e.exit_code
+        except click.Abort:
+            return 1
+        except Exception:  # pylint: disable=broad-except
+            traceback.print_exc()
+            return 1
+        finally:
+            sys.stdin = sys.__stdin__
+            self.reloader.record()
+
+        return 0
+
+
+def serve(command: click.Command, path: pathlib.Path = SOCKET_PATH):
+    for name in PRELOAD:
+        with contextlib.suppress(ImportError):
+            importlib.import_module(name)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()
+
+    with Server(path, command) as server:
+        print(f'Listening on {path}')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            path.unlink()
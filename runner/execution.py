@@ -0,0 +1,157 @@
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
+import importlib
+import io
+import pathlib
+import timeit
+import typing
+
+import cachetools
+
+import utils
+from runner import memory
+
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+# How a part run ended. Parts only end in anything but OK when run in isolation (see runner.isolation).
+OK = 'OK'
+TIMEOUT = 'TIMEOUT'
+OOM = 'OOM'
+ERROR = 'ERROR'
+
+
+class Unit(typing.NamedTuple):
+    year: int
+    day: int
+    part_id: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Options:
+    use_cache: bool = True
+    refresh: bool = False
+    profile_memory: bool = False
+    profile_calls: bool = False
+    collect_metrics: bool = False
+    timeout: typing.Optional[float] = None
+    max_rss: typing.Optional[int] = None
+
+    @property
+    def isolated(self):
+        return self.timeout is not None or self.max_rss is not None
+
+    @property
+    def profiling(self):
+        return self.profile_memory or self.profile_calls
+
+
+class Result(typing.NamedTuple):
+    output: str
+    seconds: float
+    memory: typing.Optional[typing.Any] = None
+    status: str = OK
+    answer: typing.Optional[str] = None
+    peak_rss: typing.Optional[int] = None
+
+
+class Tee(io.TextIOBase):
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+        self.captured = io.StringIO()
+
+    def write(self, text):
+        self.stream.write(text)
+        return self.captured.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def getvalue(self):
+        return self.captured.getvalue()
+
+
+@cachetools.cached({})
+def get_module(year, day):
+    return importlib.import_module(f'problems_{year}.{day}')
+
+
+def get_part(unit: Unit) -> utils.Part:
+    module = get_module(unit.year, unit.day)
+    return utils.PART_REGISTRY[module.__name__][unit.part_id]
+
+
+def configure(settings: typing.Dict[str, typing.Any]):
+    # Settings are module-level globals of utils (e.g. IS_TEST), which every worker has to set itself.
+    for name, value in settings.items():
+        setattr(utils, name, value)
+
+
+def normalize_answer(answer: typing.Any) -> typing.Optional[str]:
+    # Answers are kept as strings, whether they were returned or printed, so that they compare and serialize alike.
+    return None if answer is None else str(answer)
+
+
+def run_captured(
+    unit: Unit,
+    stream: typing.Optional[typing.TextIO] = None,
+    profile_memory: bool = False,
+) -> Result:
+    # If a stream is given, output is also written through to it as the part runs.
+    output = Tee(stream) if stream else io.StringIO()
+    cmd = get_part(unit).cmd
+    answers = []
+    report = None
+    measure_rss = memory.reset_peak_rss()
+    start = timeit.default_timer()
+
+    with contextlib.redirect_stdout(output):
+        if profile_memory:
+            report = memory.profile(lambda: answers.append(cmd()))
+        else:
+            answers.append(cmd())
+
+    return Result(
+        output.getvalue(),
+        timeit.default_timer() - start,
+        report,
+        answer=normalize_answer(answers[0]),
+        peak_rss=memory.get_peak_rss() if measure_rss else None,
+    )
+
+
+def submit_all(
+    executor: concurrent.futures.Executor,
+    func: typing.Callable[[Unit], Result],
+    units: typing.List[Unit],
+    order: typing.Optional[typing.List[Unit]] = None,
+):
+    # Units are submitted in the given order (which decides the order in which the workers pick them up), but
+    # results are yielded in the same order as the units were given, regardless of the order in which the
+    # workers finish them.
+    futures = {unit: executor.submit(func, unit) for unit in order or units}
+
+    try:
+        for unit in units:
+            yield unit, futures[unit].result()
+    finally:
+        for future in futures.values():
+            future.cancel()
+
+
+def run_parallel(
+    units: typing.List[Unit],
+    jobs: int,
+    settings: typing.Dict[str, typing.Any],
+    profile_memory: bool = False,
+    order: typing.Optional[typing.List[Unit]] = None,
+):
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=configure,
+        initargs=(settings,),
+    ) as executor:
+        yield from submit_all(executor, functools.partial(run_captured, profile_memory=profile_memory), units, order)
@@ -0,0 +1,190 @@
+import collections
+import io
+import multiprocessing
+import multiprocessing.connection
+import signal
+import sys
+import timeit
+import traceback
+import typing
+
+from runner import execution, memory
+
+
+POLL_INTERVAL = 0.01
+
+# The kinds of message a child sends back: some output that the part printed, or the part's result.
+OUTPUT = 'output'
+RESULT = 'result'
+
+
+class PipeStream(io.TextIOBase):
+    # Sends a child's output to the parent as it's printed, so that the parent still has whatever the part printed
+    # if it has to kill it.
+    def __init__(self, connection):
+        super().__init__()
+        self.connection = connection
+
+    def write(self, text):
+        if text:
+            self.connection.send((OUTPUT, text))
+        return len(text)
+
+
+def run_child(
+    unit: execution.Unit,
+    settings: typing.Dict[str, typing.Any],
+    connection,
+    stream: bool,
+    profile_memory: bool,
+):
+    execution.configure(settings)
+    # Output is flushed line by line, so that whatever a part printed before being killed isn't lost.
+    sys.stdout.reconfigure(line_buffering=True)
+
+    # The output is also captured here, so that a part that fails still reports what it printed until then.
+    output = execution.Tee(sys.stdout if stream else PipeStream(connection))
+    start = timeit.default_timer()
+
+    try:
+        result = execution.run_captured(unit, stream=output, profile_memory=profile_memory)
+    except MemoryError:
+        result = execution.Result(output.getvalue(), timeit.default_timer() - start, status=execution.OOM)
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        result = execution.Result(
+            output.getvalue() + traceback.format_exc(),
+            timeit.default_timer() - start,
+            status=execution.ERROR,
+        )
+
+    connection.send((RESULT, result))
+    connection.close()
+
+
+class Child:
+    def __init__(
+        self,
+        unit: execution.Unit,
+        settings: typing.Dict[str, typing.Any],
+        stream: bool,
+        profile_memory: bool,
+    ):
+        # If stream is set, the child prints its output as it goes (to the sys.stdout it inherits); otherwise its
+        # output is sent back to be collected here.
+        self.receiver, sender = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(
+            target=run_child,
+            args=(unit, settings, sender, stream, profile_memory),
+            daemon=True,
+        )
+        self.output = []
+
+        # Anything still buffered would otherwise be printed again by a forked child.
+        sys.stdout.flush()
+        self.start = timeit.default_timer()
+        self.process.start()
+        sender.close()
+
+    def poll(
+        self,
+        timeout: typing.Optional[float],
+        max_rss: typing.Optional[int],
+        wait: float = 0,
+    ) -> typing.Optional[execution.Result]:
+        # Returns the part's result once it has finished, or once it has exceeded one of the limits (along with
+        # the output it had printed until then), and None while it's still running.
+        while self.receiver.poll(wait):
+            wait = 0
+            try:
+                kind, value = self.receiver.recv()
+            except EOFError:
+                # The child died without sending a result. If it was killed outright while a memory limit was set,
+                # that was most likely the kernel's OOM killer.
+                self.process.join()
+                is_killed = self.process.exitcode == -signal.SIGKILL
+                return self.stopped(execution.OOM if is_killed and max_rss is not None else execution.ERROR)
+
+            if kind == RESULT:
+                return value
+            self.output.append(value)
+
+        if timeout is not None and timeit.default_timer() - self.start > timeout:
+            return self.stopped(execution.TIMEOUT)
+
+        if max_rss is not None and (memory.get_rss(self.process.pid) or 0) > max_rss:
+            return self.stopped(execution.OOM)
+
+        return None
+
+    def stopped(self, status: str) -> execution.Result:
+        return execution.Result(''.join(self.output), timeit.default_timer() - self.start, status=status)
+
+    def close(self):
+        self.process.kill()
+        self.process.join()
+        self.receiver.close()
+
+
+# pylint: disable=too-many-arguments
+def run_isolated(
+    unit: execution.Unit,
+    settings: typing.Dict[str, typing.Any],
+    timeout: typing.Optional[float] = None,
+    max_rss: typing.Optional[int] = None,
+    stream: typing.Optional[typing.TextIO] = None,
+    profile_memory: bool = False,
+) -> execution.Result:
+    # Runs the part in a child process, which is killed as soon as it exceeds one of the limits. If a stream is
+    # given, the child prints its output as it goes (the stream is then expected to be sys.stdout, which the
+    # child inherits); otherwise its output is only returned once it finishes.
+    child = Child(unit, settings, stream is not None, profile_memory)
+
+    try:
+        while True:
+            result = child.poll(timeout, max_rss, wait=POLL_INTERVAL)
+            if result is not None:
+                return result
+    finally:
+        child.close()
+
+
+# pylint: disable=too-many-arguments
+def run_parallel(
+    units: typing.List[execution.Unit],
+    jobs: int,
+    settings: typing.Dict[str, typing.Any],
+    timeout: typing.Optional[float] = None,
+    max_rss: typing.Optional[int] = None,
+    profile_memory: bool = False,
+    order: typing.Optional[typing.List[execution.Unit]] = None,
+):
+    # Up to the given number of child processes run at once, all started and watched from this thread (forking
+    # from other threads risks the child inheriting locks that they held). Children are started in the given
+    # order, but results are yielded in the order of the units.
+    pending = collections.deque(order or units)
+    running = {}
+    results = {}
+    remaining = collections.deque(units)
+
+    try:
+        while remaining:
+            while pending and len(running) < jobs:
+                unit = pending.popleft()
+                running[unit] = Child(unit, settings, False, profile_memory)
+
+            multiprocessing.connection.wait([child.receiver for child in running.values()], timeout=POLL_INTERVAL)
+
+            for unit, child in list(running.items()):
+                result = child.poll(timeout, max_rss)
+                if result is not None:
+                    child.close()
+                    del running[unit]
+                    results[unit] = result
+
+            while remaining and remaining[0] in results:
+                unit = remaining.popleft()
+                yield unit, results.pop(unit)
+    finally:
+        for child in running.values():
+            child.close()
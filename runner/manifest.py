@@ -0,0 +1,67 @@
+import ast
+import json
+import pathlib
+import re
+import typing
+
+from runner.execution import ROOT
+
+
+MANIFEST_PATH = ROOT / '.cache' / 'manifest.json'
+
+
+def is_part_decorator(decorator: ast.expr) -> bool:
+    if isinstance(decorator, ast.Attribute):
+        return isinstance(decorator.value, ast.Name) and decorator.value.id == 'utils' and decorator.attr == 'part'
+    return isinstance(decorator, ast.Name) and decorator.id == 'part'
+
+
+def scan(path: pathlib.Path) -> typing.List[str]:
+    tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+
+    # This mirrors how utils.part derives part IDs from function names.
+    return [
+        node.name.removeprefix('part_')
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and any(is_part_decorator(d) for d in node.decorator_list)
+    ]
+
+
+def load() -> dict:
+    try:
+        with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save(manifest: dict):
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def get_parts(year: int) -> typing.Dict[int, typing.List[str]]:
+    manifest = load()
+    changed = False
+    parts_by_day = {}
+
+    for path in sorted((ROOT / f'problems_{year}').iterdir()):
+        if not re.fullmatch(r'\d+\.py', path.name):
+            continue
+
+        # Entries are keyed by path relative to the root, and are rescanned whenever the file changes.
+        key = path.relative_to(ROOT).as_posix()
+        mtime = path.stat().st_mtime
+        entry = manifest.get(key)
+
+        if not entry or entry['mtime'] != mtime:
+            entry = manifest[key] = {'mtime': mtime, 'parts': scan(path)}
+            changed = True
+
+        parts_by_day[int(path.stem)] = entry['parts']
+
+    if changed:
+        save(manifest)
+
+    return parts_by_day
@@ -0,0 +1,168 @@
+import collections
+import contextlib
+import dataclasses
+import gc
+import io
+import os
+import resource
+import sys
+import threading
+import tracemalloc
+import typing
+
+
+SAMPLE_INTERVAL = 0.01
+
+# A new snapshot is only taken once traced memory has grown by this fraction since the last one, since
+# snapshots are expensive.
+SNAPSHOT_GROWTH = 0.1
+
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+]
+
+
+@dataclasses.dataclass
+class Report:
+    peak_traced: int
+    peak_rss: typing.Optional[int]
+    top_sites: typing.List[typing.Tuple[str, int]]
+    top_types: typing.List[typing.Tuple[str, int]]
+
+    def to_dict(self):
+        return {
+            'peak_traced': self.peak_traced,
+            'peak_rss': self.peak_rss,
+            'top_sites': [{'site': site, 'size': size} for site, size in self.top_sites],
+            'top_types': [{'type': type_name, 'count': count} for type_name, count in self.top_types],
+        }
+
+
+def format_bytes(size: float) -> str:
+    for unit in ['B', 'KB', 'MB']:
+        if abs(size) < 1024:
+            return f'{size:.1f}{unit}'
+        size /= 1024
+    return f'{size:.1f}GB'
+
+
+def get_rss(pid: typing.Optional[int] = None) -> typing.Optional[int]:
+    try:
+        with open(f'/proc/{pid or "self"}/statm', 'r', encoding='utf-8') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        pass
+
+    if pid is not None:
+        return None
+
+    # Without /proc, fall back to the peak RSS of the whole process so far (which macOS reports in bytes
+    # and Linux in kilobytes).
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def reset_peak_rss() -> bool:
+    # Linux resets the peak RSS it reports for a process (VmHWM) when 5 is written to its clear_refs.
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='utf-8') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def get_peak_rss() -> typing.Optional[int]:
+    try:
+        with open('/proc/self/status', 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class Sampler(threading.Thread):
+    def __init__(self, top: int):
+        super().__init__(daemon=True)
+        self.top = top
+        self.stopped = threading.Event()
+        self.peak_rss = get_rss()
+        self.snapshot_size = 0
+        self.top_sites = []
+
+    def sample(self):
+        rss = get_rss()
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss or 0, rss)
+
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * (1 + SNAPSHOT_GROWTH):
+            self.snapshot_size = current
+            snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+            self.top_sites = [
+                (f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}', stat.size)
+                for stat in snapshot.statistics('lineno')[:self.top]
+            ]
+
+    def run(self):
+        while not self.stopped.wait(SAMPLE_INTERVAL):
+            self.sample()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def count_live_objects(top: int) -> typing.List[typing.Tuple[str, int]]:
+    # Walks the whole heap, so it's only done once, from the thread that ran the part rather than the sampler.
+    # Only objects tracked by the garbage collector (i.e. containers) are counted.
+    return collections.Counter(type(obj).__qualname__ for obj in gc.get_objects()).most_common(top)
+
+
+def profile(cmd: typing.Callable, top: int = 10) -> Report:
+    tracemalloc.start()
+    sampler = Sampler(top)
+    sampler.start()
+
+    try:
+        cmd()
+    finally:
+        sampler.stop()
+        # A part that finishes before the first sample is taken is at least sampled once at the end.
+        if not sampler.top_sites:
+            sampler.sample()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        top_types = count_live_objects(top)
+
+    return Report(peak, sampler.peak_rss, sampler.top_sites, top_types)
+
+
+def format_report(report: Report) -> str:
+    lines = [
+        f'[memory] peak traced: {format_bytes(report.peak_traced)} | '
+        f'peak RSS: {format_bytes(report.peak_rss) if report.peak_rss is not None else "unknown"}',
+        '  top allocation sites:',
+        *[f'    {format_bytes(size):>10}  {site}' for site, size in report.top_sites],
+        '  live objects by type:',
+        *[f'    {count:>10,}  {type_name}' for type_name, count in report.top_types],
+    ]
+    return '\n'.join(lines)
+
+
+def measure_peak(cmd: typing.Callable) -> typing.Tuple[typing.Any, int]:
+    # Returns what the command returned along with the peak memory traced while it ran. Its output is discarded.
+    tracemalloc.start()
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = cmd()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, peak
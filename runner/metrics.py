@@ -0,0 +1,69 @@
+import contextlib
+import dataclasses
+import typing
+
+import utils
+from runner.bench import format_seconds
+
+
+@dataclasses.dataclass
+class SpanStats:
+    calls: int
+    inclusive: float
+    exclusive: float
+
+
+@dataclasses.dataclass
+class Report:
+    counters: typing.Dict[str, int]
+    spans: typing.Dict[str, SpanStats]
+
+    def to_dict(self):
+        return {
+            'counters': self.counters,
+            'spans': {name: dataclasses.asdict(stats) for name, stats in self.spans.items()},
+        }
+
+
+def collect() -> Report:
+    return Report(
+        {name: counter.count for name, counter in utils.COUNTERS.items()},
+        {name: SpanStats(span.calls, span.inclusive, span.exclusive) for name, span in utils.SPANS.items()},
+    )
+
+
+def profile(cmd: typing.Callable) -> Report:
+    with utils.instrumented():
+        cmd()
+    return collect()
+
+
+def format_report(report: Report) -> str:
+    if not report.counters and not report.spans:
+        return '[metrics] no counters or spans recorded'
+
+    lines = ['[metrics]']
+
+    if report.counters:
+        width = max(len(name) for name in report.counters)
+        lines.append('  counters:')
+        lines.extend(f'    {name:<{width}}  {count:>14,}' for name, count in sorted(report.counters.items()))
+
+    if report.spans:
+        width = max(len(name) for name in report.spans)
+        lines.append('  spans:')
+        lines.append(f'    {"":<{width}}  {"calls":>14}  {"inclusive":>10}  {"exclusive":>10}')
+        lines.extend(
+            f'    {name:<{width}}  {stats.calls:>14,}  '
+            f'{format_seconds(stats.inclusive):>10}  {format_seconds(stats.exclusive):>10}'
+            for name, stats in sorted(report.spans.items(), key=lambda item: -item[1].inclusive)
+        )
+
+    return '\n'.join(lines)
+
+
+@contextlib.contextmanager
+def hook(module: str, part_id: str):  # pylint: disable=unused-argument
+    with utils.instrumented():
+        yield
+    print(format_report(collect()))
@@ -0,0 +1,81 @@
+import collections
+import contextlib
+import cProfile
+import os
+import pathlib
+import pstats
+import sys
+import threading
+import typing
+
+
+def get_profile_name(module: str, part_id: str) -> str:
+    return f'{module.replace(".", "_")}_part_{part_id}'
+
+
+@contextlib.contextmanager
+def cprofile(directory: str, top: int, module: str, part_id: str):
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+
+        path = pathlib.Path(directory) / f'{get_profile_name(module, part_id)}.pstats'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(path)
+
+        print(f'[cprofile] written to {path}')
+        pstats.Stats(profiler, stream=sys.stdout).sort_stats('cumulative').print_stats(top)
+
+
+def get_frame_label(frame) -> str:
+    code = frame.f_code
+    return f'{code.co_name} ({os.path.relpath(code.co_filename)}:{code.co_firstlineno})'
+
+
+class StackSampler(threading.Thread):
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.stacks: typing.Counter[str] = collections.Counter()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)  # pylint: disable=protected-access
+
+            labels = []
+            while frame is not None:
+                labels.append(get_frame_label(frame))
+                frame = frame.f_back
+
+            # Collapsed stacks are listed from the root frame down, separated by semicolons.
+            if labels:
+                self.stacks[';'.join(reversed(labels))] += 1
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+@contextlib.contextmanager
+def sample(directory: str, interval: float, module: str, part_id: str):
+    sampler = StackSampler(threading.get_ident(), interval)
+    sampler.start()
+
+    try:
+        yield
+    finally:
+        sampler.stop()
+
+        path = pathlib.Path(directory) / f'{get_profile_name(module, part_id)}.collapsed'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(sampler.stacks.items()):
+                f.write(f'{stack} {count}\n')
+
+        print(f'[sample] {sum(sampler.stacks.values())} samples written to {path}')
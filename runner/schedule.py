@@ -0,0 +1,82 @@
+import json
+import re
+import typing
+
+from runner.bench import format_seconds
+from runner.execution import OK, ROOT, Result, Unit
+
+
+HISTORY_PATH = ROOT / '.cache' / 'runtimes.json'
+
+YEARS_PATTERN = re.compile(r'^(\d{4})(?:-(\d{4}))?$')
+
+
+def parse_years(text: str) -> typing.List[int]:
+    # Accepts comma-separated years and inclusive ranges of years, e.g. 2019-2021,2022.
+    years = []
+
+    for item in text.split(','):
+        match = YEARS_PATTERN.match(item.strip())
+        if not match:
+            raise ValueError(f'Invalid year or range of years {item!r}')
+
+        start, end = int(match.group(1)), int(match.group(2) or match.group(1))
+        if end < start:
+            raise ValueError(f'Invalid range of years {item!r}')
+
+        years.extend(year for year in range(start, end + 1) if year not in years)
+
+    return years
+
+
+def get_history_key(unit: Unit) -> str:
+    return f'{unit.year}/{unit.day}/{unit.part_id}'
+
+
+def load_history() -> typing.Dict[str, float]:
+    if not HISTORY_PATH.exists():
+        return {}
+
+    with open(HISTORY_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def record(results: typing.Dict[Unit, Result]):
+    history = load_history()
+
+    for unit, result in results.items():
+        if result.status == OK:
+            history[get_history_key(unit)] = result.seconds
+
+    HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(HISTORY_PATH, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+
+
+def order(units: typing.List[Unit], history: typing.Dict[str, float]) -> typing.List[Unit]:
+    # Longest parts first, so that no long part is left to start once the other workers are about to run out of
+    # work. Parts that have never run are assumed to be long, so that they can't end up at the very end either.
+    return sorted(units, key=lambda unit: -history.get(get_history_key(unit), float('inf')))
+
+
+def format_summary(results: typing.Dict[Unit, Result], elapsed: float, jobs: int, top: int = 5) -> str:
+    total = sum(result.seconds for result in results.values())
+    longest = sorted(results.items(), key=lambda item: -item[1].seconds)
+    critical_unit, critical_result = longest[0]
+
+    # No schedule can finish before the longest part does, or before the total work is spread evenly over the
+    # workers.
+    lower_bound = max(critical_result.seconds, total / jobs)
+
+    lines = [
+        f'Ran {len(results)} part(s) in {format_seconds(elapsed)} on {jobs} worker(s) '
+        f'({format_seconds(total)} in total, lower bound {format_seconds(lower_bound)})',
+        f'Critical path: {critical_unit.year}/{critical_unit.day} part {critical_unit.part_id} '
+        f'({format_seconds(critical_result.seconds)})',
+        'Longest parts:',
+        *[
+            f'  {format_seconds(result.seconds):>10}  {unit.year}/{unit.day} part {unit.part_id}'
+            for unit, result in longest[:top]
+        ],
+    ]
+    return '\n'.join(lines)
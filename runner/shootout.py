@@ -0,0 +1,101 @@
+import collections
+import dataclasses
+import re
+import typing
+
+from runner import bench, execution, memory
+
+
+@dataclasses.dataclass
+class Entry:
+    unit: execution.Unit
+    stats: typing.Optional[bench.Stats]
+    answer: typing.Optional[str]
+    peak: typing.Optional[int]
+
+
+def get_base_id(part_id: str) -> str:
+    # Variants of a part are registered as e.g. part_2, part_2_bfs and part_2_dag.
+    match = re.match(r'\d+', part_id)
+    return match.group() if match else part_id
+
+
+def group_variants(units: typing.List[execution.Unit]) -> typing.Dict[str, typing.List[execution.Unit]]:
+    groups = collections.defaultdict(list)
+    for unit in units:
+        groups[get_base_id(unit.part_id)].append(unit)
+    return dict(sorted(groups.items()))
+
+
+def run_variant(unit: execution.Unit, repeat: int, warmup: int) -> Entry:
+    cmd = execution.get_part(unit).cmd
+
+    # A variant that fails is reported rather than stopping the whole shootout.
+    try:
+        stats = bench.benchmark(cmd, repeat, warmup)
+        # Memory is measured after the timed runs, so that one-off costs such as lazy imports aren't
+        # counted against the variant.
+        answer, peak = memory.measure_peak(cmd)
+    except Exception as e:  # pylint: disable=broad-except
+        return Entry(unit, None, f'ERROR: {e!r}', None)
+
+    # Variants are compared by their answers (what they returned, or else the last line they printed), so that
+    # any progress or debug output they print along the way doesn't count.
+    return Entry(unit, stats, execution.normalize_answer(answer), peak)
+
+
+# The header and the rows of the ranking share one format, so that their columns line up.
+ROW_FORMAT = '{:<4}  {:<{width}}  {:>10}  {:>10}  {:>10}  {:>10}  {}'
+
+
+def format_table(base_id: str, entries: typing.List[Entry]) -> str:
+    failed = [entry for entry in entries if not entry.stats]
+    entries = sorted((entry for entry in entries if entry.stats), key=lambda entry: entry.stats.median)
+    width = max(len('variant'), *(len(entry.unit.part_id) for entry in entries + failed))
+    lines = []
+
+    if entries:
+        # Speedups are relative to the plain part (e.g. part_2) if there is one, and to the slowest
+        # variant otherwise.
+        reference = next((entry for entry in entries if entry.unit.part_id == base_id), entries[-1])
+        lines.append(ROW_FORMAT.format(
+            'rank', 'variant', 'median', 'min', 'p95', 'peak', f'vs {reference.unit.part_id}', width=width,
+        ))
+
+    for rank, entry in enumerate(entries, start=1):
+        lines.append(ROW_FORMAT.format(
+            rank,
+            entry.unit.part_id,
+            bench.format_seconds(entry.stats.median),
+            bench.format_seconds(entry.stats.min),
+            bench.format_seconds(entry.stats.p95),
+            memory.format_bytes(entry.peak),
+            f'{reference.stats.median / entry.stats.median:.2f}x',
+            width=width,
+        ))
+
+    answers = collections.defaultdict(list)
+    for entry in entries + failed:
+        answers[entry.answer].append(entry.unit.part_id)
+
+    if len(answers) == 1:
+        lines.append(f'All variants agree: {next(iter(answers))}')
+    else:
+        lines.append('MISMATCH: variants disagree:')
+        lines.extend(f'  {", ".join(part_ids)}: {answer}' for answer, part_ids in answers.items())
+
+    return '\n'.join(lines)
+
+
+def run(units: typing.List[execution.Unit], repeat: int, warmup: int) -> bool:
+    agree = True
+
+    for base_id, variants in group_variants(units).items():
+        entries = [run_variant(unit, repeat, warmup) for unit in variants]
+        agree &= len({entry.answer for entry in entries}) == 1
+
+        print(f'=== {variants[0].year}/{variants[0].day} part {base_id} ===')
+        print(format_table(base_id, entries))
+        print()
+
+    return agree
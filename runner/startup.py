@@ -0,0 +1,73 @@
+import collections
+import re
+import subprocess
+import sys
+import typing
+
+from runner.execution import ROOT
+
+
+IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+
+class ImportTime(typing.NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self):
+        return self.module.split('.')[0]
+
+
+def measure(year: int, day: int) -> typing.List[ImportTime]:
+    # Imports are measured in a fresh interpreter, since anything already imported by this process
+    # would otherwise be free.
+    code = f'import utils; __import__("problems_{year}.{day}")'
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    entries = []
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append(ImportTime(module, int(self_us), int(cumulative_us), len(indent) // 2))
+
+    # Everything up to site is interpreter startup, which is paid regardless of what is imported.
+    site_index = next(i for i, entry in enumerate(entries) if entry.module == 'site' and entry.depth == 0)
+    return entries[site_index + 1:]
+
+
+def format_ms(us: int) -> str:
+    return f'{us / 1000:.1f}ms'
+
+
+def format_report(year: int, day: int, entries: typing.List[ImportTime], top: int = 10) -> str:
+    top_level = {entry.module: entry for entry in entries if entry.depth == 0}
+    module = f'problems_{year}.{day}'
+    total = sum(entry.cumulative_us for entry in top_level.values())
+
+    self_by_package = collections.Counter()
+    for entry in entries:
+        self_by_package[entry.package] += entry.self_us
+
+    lines = [
+        f'--- STARTUP {year}/{day} ---',
+        f'total: {format_ms(total)} '
+        f'(utils: {format_ms(top_level["utils"].cumulative_us)}, '
+        f'{module}: {format_ms(top_level[module].cumulative_us)})',
+    ]
+    width = max(len(package) for package, _ in self_by_package.most_common(top))
+    lines.extend(
+        f'  {package:<{width}}  {format_ms(self_us)}'
+        for package, self_us in self_by_package.most_common(top)
+    )
+
+    return '\n'.join(lines)
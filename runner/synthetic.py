@@ -0,0 +1,104 @@
+import pathlib
+import random
+import typing
+
+from runner.execution import ROOT
+
+
+SCRATCH_DIR = ROOT / '.cache' / 'synthetic'
+
+# Functions that write a valid input for a day, of a size proportional to the scale, using only the given random
+# number generator (so that inputs are reproducible from their seed).
+GENERATORS: typing.Dict[typing.Tuple[int, int], typing.Callable[[int, random.Random], str]] = {}
+
+
+def generator(year: int, day: int):
+    def decorator(func):
+        GENERATORS[(year, day)] = func
+        return func
+    return decorator
+
+
+def get_path(year: int, day: int, scale: int, seed: int) -> pathlib.Path:
+    return SCRATCH_DIR / f'problems_{year}' / f'{day}_scale_{scale}_seed_{seed}.txt'
+
+
+def get_available() -> str:
+    return ', '.join(f'{year}/{day}' for year, day in sorted(GENERATORS))
+
+
+def check(year: int, day: int):
+    if (year, day) not in GENERATORS:
+        raise ValueError(f'No synthetic input generator for {year}/{day} (available: {get_available()})')
+
+
+def generate(year: int, day: int, scale: int, seed: int = 0) -> pathlib.Path:
+    check(year, day)
+
+    path = get_path(year, day, scale, seed)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(GENERATORS[(year, day)](scale, random.Random(seed)), encoding='utf-8')
+
+    return path
+
+
+@generator(2021, 5)
+def vents(scale: int, rng: random.Random) -> str:
+    # Horizontal, vertical and diagonal lines on the same 1000x1000 grid as the real input, so that larger scales
+    # mean more (and more overlapping) lines rather than longer ones.
+    size = 1000
+    lines = []
+
+    for _ in range(scale):
+        dx, dy = rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)])
+        length = rng.randint(1, 300)
+
+        # The line starts far enough from the edges of the grid that it ends inside it.
+        x_1, y_1 = [
+            rng.randint(length if step < 0 else 0, size - 1 - (length if step > 0 else 0))
+            for step in [dx, dy]
+        ]
+
+        lines.append(f'{x_1},{y_1} -> {x_1 + dx * length},{y_1 + dy * length}')
+
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2022, 20)
+def encrypted_file(scale: int, rng: random.Random) -> str:
+    # Exactly one number is 0, since the grove coordinates are counted from it. They are the numbers 1000, 2000
+    # and 3000 after it, so lengths that divide any of those are extended to avoid landing back on the 0.
+    length = max(scale, 2)
+    while any(offset % length == 0 for offset in (1000, 2000, 3000)):
+        length += 1
+
+    # Numbers are drawn from well beyond the length of the file at any scale, so that each of them moves a
+    # different distance around the file rather than mostly staying close to where it started.
+    bound = 10 * max(scale, 1000)
+    numbers = [rng.choice([-1, 1]) * rng.randint(1, bound) for _ in range(length - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    return '\n'.join(str(number) for number in numbers) + '\n'
+
+
+@generator(2021, 22)
+def reboot_steps(scale: int, rng: random.Random) -> str:
+    # Like the real input, the first steps fall inside the initialization area, and the rest are large cuboids
+    # anywhere in the reactor.
+    steps = []
+
+    for i in range(scale):
+        bound, max_size = (50, 50) if i < max(scale // 10, 1) else (100_000, 50_000)
+        ranges = []
+
+        for _ in range(3):
+            lower = rng.randint(-bound, bound)
+            upper = min(lower + rng.randint(0, max_size), bound)
+            ranges.append((lower, upper))
+
+        state = 'on' if i == 0 or rng.random() < 0.6 else 'off'
+        steps.append(f'{state} ' + ','.join(
+            f'{axis}={lower}..{upper}' for axis, (lower, upper) in zip('xyz', ranges)
+        ))
+
+    return '\n'.join(steps) + '\n'
@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional
+
+import collections
+import contextlib
+import dataclasses
+import datetime
+import enum
+import functools
+import hashlib
+import io
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+import timeit
+import types
+
+from utils import settings
+from utils.grids import (
+    CSRGraph,
+    DenseGrid,
+    DiagonalDenseGrid,
+    DiagonalGrid,
+    DirectedDenseGrid,
+    DirectedGrid,
+    Grid,
+    get_grid,
+)
+from utils.inputs import (
+    INPUT_CACHE,
+    INPUT_PATH,
+    _get_calling_module,
+    compile_format,
+    get_array,
+    get_char_grid,
+    get_digit_grid,
+    get_input,
+    get_input_path,
+    parse,
+    parse_format,
+    using_input,
+)
+from utils.lazy import LAZY_CONSTANTS, LazyModule, lazy_constant, lazy_import
+from utils.vectors import (
+    DIRECTIONS,
+    ORIGIN,
+    Direction,
+    Vector,
+    Vector2D,
+    Vector3D,
+    get_directions,
+    neighbors_batch,
+    sign,
+)
+
+
+iterutils = lazy_import('boltons.iterutils')
+humanize = lazy_import('humanize')
+
+
+PART_REGISTRY = collections.defaultdict(dict)
+
+# The runner's settings (e.g. IS_TEST) live in utils.settings, so that the submodules can read them without
+# importing the package back, but they are still read and set as utils.<name>.
+SETTINGS = frozenset(name for name in vars(settings) if name.isupper())
+
+# Whether utils.counter and utils.span record anything. When disabled they hand out shared no-op objects, so
+# instrumentation can be left in hot loops.
+IS_INSTRUMENTED = False
+COUNTERS: Dict[str, Counter] = {}
+SPANS: Dict[str, Span] = {}
+
+
+class Checkpoint:
+    # How many calls to due() go by between checks of the clock, so that it can be called on every iteration of
+    # a hot loop.
+    CHECK_EVERY = 1024
+
+    def __init__(self, path: pathlib.Path, key: str, interval: float):
+        self.path = path
+        self.key = key
+        self.interval = interval
+        self.saved_at = timeit.default_timer()
+        self.calls = 0
+
+    def load(self, default: Any = None) -> Any:
+        if not settings.RESUME or not self.path.exists():
+            return default
+
+        with open(self.path, 'rb') as f:
+            key, state = pickle.load(f)
+
+        # A checkpoint saved for another input or another version of the solution is no use.
+        return state if key == self.key else default
+
+    def due(self) -> bool:
+        self.calls += 1
+        if self.calls % self.CHECK_EVERY:
+            return False
+        return timeit.default_timer() - self.saved_at >= self.interval
+
+    def save(self, state: Any):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The state is written to a temporary file first, so that being killed mid-write can't corrupt the last
+        # checkpoint. Each save gets a file of its own, so that concurrent runs can't replace each other's.
+        with tempfile.NamedTemporaryFile(dir=self.path.parent, suffix='.tmp', delete=False) as f:
+            try:
+                pickle.dump((self.key, state), f, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, self.path)
+
+        self.saved_at = timeit.default_timer()
+
+    def clear(self):
+        self.path.unlink(missing_ok=True)
+
+
+def checkpoint(name: str, interval: Optional[float] = None) -> Checkpoint:
+    module = _get_calling_module()
+    problem_path = pathlib.Path(module.__file__).resolve()
+    input_path = get_input_path(str(problem_path))
+
+    digest = hashlib.sha256()
+    for chunk in [input_path.read_bytes() if input_path.exists() else b'', problem_path.read_bytes()]:
+        digest.update(hashlib.sha256(chunk).digest())
+
+    # Checkpoints are kept per input and version of the solution, so that runs of the same part on different
+    # inputs (e.g. with --inputs-dir) don't share one.
+    key = digest.hexdigest()
+    return Checkpoint(
+        problem_path.parent.parent / '.cache' / 'checkpoints' / module.__name__ / f'{name}_{key[:16]}.pickle',
+        key,
+        settings.CHECKPOINT_INTERVAL if interval is None else interval,
+    )
+
+
+class MultiValueEnum(enum.Enum):
+    def __new__(cls, *values):
+        obj = object.__new__(cls)
+        # first value is canonical value
+        obj._value_ = values[0]
+        for other_value in values[1:]:
+            cls._value2member_map_[other_value] = obj
+        obj._all_values = values
+        return obj
+
+    def values(self):
+        cls = type(self)
+        return [value for value in cls._value2member_map_ if cls._value2member_map_[value] == self]
+
+
+class CircularList(list):
+    def __getitem__(self, key):
+        return super().__getitem__(key % len(self))
+
+
+def assert_one(iterable, key=None):
+    item = iterutils.one(iterable, key=key)
+    assert item is not None
+    return item
+
+
+@dataclasses.dataclass(frozen=True)
+class Part:
+    id: str
+    cmd: Callable
+
+
+class Counter:
+    __slots__ = ('count',)
+
+    def __init__(self):
+        self.count = 0
+
+    def incr(self, amount: int = 1):
+        self.count += amount
+
+
+class Span:
+    __slots__ = ('calls', 'inclusive', 'exclusive')
+
+    # Each entry is [span, start time, time spent in nested spans], so that the time of a span can be split
+    # into the time spent in it overall (inclusive) and outside of any span nested in it (exclusive).
+    STACK: List[list] = []
+
+    def __init__(self):
+        self.calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+
+    def __enter__(self):
+        Span.STACK.append([self, timeit.default_timer(), 0.0])
+        return self
+
+    def __exit__(self, *exc_info):
+        _, start, nested = Span.STACK.pop()
+        elapsed = timeit.default_timer() - start
+
+        self.calls += 1
+        self.inclusive += elapsed
+        self.exclusive += elapsed - nested
+
+        if Span.STACK:
+            Span.STACK[-1][2] += elapsed
+
+
+class _NullCounter:
+    __slots__ = ()
+
+    def incr(self, amount: int = 1):
+        pass
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_COUNTER = _NullCounter()
+_NULL_SPAN = _NullSpan()
+
+
+def counter(name: str) -> Counter:
+    if not IS_INSTRUMENTED:
+        return _NULL_COUNTER
+
+    if name not in COUNTERS:
+        COUNTERS[name] = Counter()
+    return COUNTERS[name]
+
+
+def span(name: str) -> Span:
+    if not IS_INSTRUMENTED:
+        return _NULL_SPAN
+
+    if name not in SPANS:
+        SPANS[name] = Span()
+    return SPANS[name]
+
+
+@contextlib.contextmanager
+def instrumented():
+    global IS_INSTRUMENTED  # pylint: disable=global-statement
+
+    COUNTERS.clear()
+    SPANS.clear()
+    Span.STACK.clear()
+    IS_INSTRUMENTED = True
+
+    try:
+        yield
+    finally:
+        IS_INSTRUMENTED = False
+
+
+def format_elapsed(seconds: float) -> str:
+    return humanize.precisedelta(datetime.timedelta(seconds=seconds), minimum_unit='milliseconds')
+
+
+def timed(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = timeit.default_timer()
+        response = func(*args, **kwargs)
+        elapsed = format_elapsed(timeit.default_timer() - start)
+
+        if func.__name__.startswith('part_'):
+            print(f'[{elapsed}]')
+        else:
+            print(f'[{func.__name__}: {elapsed}]')
+
+        return response
+    return wrapper
+
+
+class _LastLineTracker(io.TextIOBase):
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+        self.last_line = None
+
+    def write(self, text):
+        lines = text.strip().splitlines()
+        if lines:
+            self.last_line = lines[-1].strip()
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def answered(func):
+    # Makes the part return its answer: either what the part itself returned (which is then printed, as though
+    # the part had printed it), or else the last line it printed.
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tracker = _LastLineTracker(sys.stdout)
+        with contextlib.redirect_stdout(tracker):
+            answer = func(*args, **kwargs)
+
+        if answer is None:
+            return tracker.last_line
+
+        print(answer)
+        return answer
+    return wrapper
+
+
+def hooked(module: str, part_id: str, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not settings.PART_HOOKS:
+            return func(*args, **kwargs)
+
+        with contextlib.ExitStack() as stack:
+            for hook in settings.PART_HOOKS:
+                stack.enter_context(hook(module, part_id))
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def part(func):
+    path = _get_calling_module().__name__
+    part_id = func.__name__.removeprefix('part_')
+
+    # Parts are registered so that they return their answer, while the function itself is returned unchanged
+    # for other parts to call.
+    cmd = answered(func)
+
+    if settings.IS_TIMED:
+        func = timed(func)
+        cmd = timed(cmd)
+
+    PART_REGISTRY[path][str(part_id)] = Part(part_id, hooked(path, part_id, cmd))
+    return func
+
+
+class _UtilsModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        if name in SETTINGS:
+            setattr(settings, name, value)
+        else:
+            super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _UtilsModule
+
+
+def __getattr__(name):
+    if name in SETTINGS:
+        return getattr(settings, name)
+
+    if name in LAZY_CONSTANTS:
+        value = globals()[name] = LAZY_CONSTANTS[name]()
+        return value
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
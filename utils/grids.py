@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+import copy
+import dataclasses
+import functools
+
+from utils.inputs import _get_calling_module, get_char_grid, get_digit_grid, get_input
+from utils.lazy import lazy_import
+from utils.vectors import Vector2D, _new_tuple, get_directions
+
+np = lazy_import('numpy')
+nx = lazy_import('networkx')
+
+
+@dataclasses.dataclass
+class CSRGraph:
+    # A directed graph over the nodes 0 to n - 1 in compressed sparse row form: the neighbors of node u are
+    # indices[indptr[u]:indptr[u + 1]], over edges with the matching weights (if any). Nothing is allocated per
+    # node, so it stays small and quick to build where a networkx graph of the same grid wouldn't.
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_edges(cls, n_nodes: int, sources, targets, weights=None) -> CSRGraph:
+        sources = np.asarray(sources, dtype=np.int32)
+        order = np.argsort(sources, kind='stable')
+
+        indptr = np.zeros(n_nodes + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=n_nodes), out=indptr[1:])
+
+        return cls(
+            indptr,
+            np.asarray(targets, dtype=np.int32)[order],
+            None if weights is None else np.asarray(weights)[order],
+        )
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def neighbors(self, node: int) -> np.ndarray:
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def edge_weights(self, node: int) -> np.ndarray:
+        return self.weights[self.indptr[node]:self.indptr[node + 1]]
+
+    def reverse(self) -> CSRGraph:
+        sources = np.repeat(np.arange(len(self), dtype=np.int32), np.diff(self.indptr))
+        return CSRGraph.from_edges(len(self), self.indices, sources, self.weights)
+
+
+class Grid:
+    include_diagonals = False
+
+    def __init__(
+        self,
+        points: Dict[Vector2D, Any],
+        rows: int,
+        columns: int,
+        parse_graph: bool = True,
+    ):
+        self.points = points
+        self.rows = rows
+        self.columns = columns
+        self.parse_graph = parse_graph
+
+    @functools.cached_property
+    def graph(self):
+        # Building a networkx graph of a large grid is slow and takes a lot of memory, so it's only done for
+        # parts that use it.
+        return self.to_graph() if self.parse_graph else None
+
+    def __getitem__(self, point: Vector2D):
+        return self.points[point]
+
+    def __setitem__(self, point: Vector2D, value):
+        self.points[point] = value
+
+    def __iter__(self):
+        for point in self.points:
+            yield point
+
+    def __len__(self):
+        return len(self.points)
+
+    def __contains__(self, point):
+        return point in self.points
+
+    def items(self):
+        for point, value in self.points.items():
+            yield point, value
+
+    def neighbors(self, point: Vector2D):
+        for neighbor in self.graph.neighbors(point):
+            yield neighbor
+
+    def clone(self):
+        return type(self)(copy.deepcopy(self.points), self.rows, self.columns, parse_graph=self.parse_graph)
+
+    @functools.cached_property
+    def nodes(self) -> List[Vector2D]:
+        return list(self.points)
+
+    @functools.cached_property
+    def node_indices(self) -> Dict[Vector2D, int]:
+        return {point: index for index, point in enumerate(self.nodes)}
+
+    def get_index(self, point: Vector2D) -> int:
+        return self.node_indices[point]
+
+    def get_point(self, index: int) -> Vector2D:
+        return self.nodes[index]
+
+    def to_csr(
+        self,
+        is_edge: Optional[Callable[[Any, Any], bool]] = None,
+        weight: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> CSRGraph:
+        # Points are numbered as the grid iterates over them (see get_index). is_edge and weight are called with
+        # the values at either end of an edge.
+        sources, targets, weights = [], [], []
+
+        for point, value in self.points.items():
+            for neighbor in point.neighbors(self.include_diagonals):
+                if neighbor in self.points and (is_edge is None or is_edge(value, self.points[neighbor])):
+                    sources.append(self.node_indices[point])
+                    targets.append(self.node_indices[neighbor])
+                    if weight is not None:
+                        weights.append(weight(value, self.points[neighbor]))
+
+        return CSRGraph.from_edges(len(self.points), sources, targets, weights if weight is not None else None)
+
+    def to_graph(self):
+        graph = nx.Graph()
+        for point, value in self.points.items():
+            graph.add_node(point, value=value)
+
+        for point in self.points:
+            for neighbor in point.neighbors():
+                if neighbor in self.points:
+                    graph.add_edge(point, neighbor)
+
+        return graph
+
+
+class DiagonalGrid(Grid):
+    include_diagonals = True
+
+    def to_graph(self):
+        graph = nx.Graph()
+        for point, value in self.points.items():
+            graph.add_node(point, value=value)
+
+        for point in self.points:
+            for neighbor in point.neighbors(include_diagonals=True):
+                if neighbor in self.points:
+                    graph.add_edge(point, neighbor)
+
+        return graph
+
+
+class DirectedGrid(Grid):
+    def to_graph(self):
+        graph = nx.DiGraph()
+        for point, value in self.points.items():
+            graph.add_node(point, value=value)
+
+        for point in self.points:
+            for neighbor in point.neighbors():
+                if neighbor in self.points:
+                    graph.add_edge(point, neighbor)
+                    graph.add_edge(neighbor, point)
+
+        return graph
+
+
+class DenseGrid:
+    # A drop-in for Grid over a rectangular numpy array, which takes a fraction of the memory of a dict with a
+    # Vector2D key for every cell. It can also be indexed with boolean masks of the same shape as the array.
+    include_diagonals = False
+    directed = False
+
+    def __init__(self, array, parse_graph: bool = True):
+        self.array = np.asarray(array)
+        self.directions = get_directions(2, self.include_diagonals)
+        self.parse_graph = parse_graph
+
+    @functools.cached_property
+    def graph(self):
+        return self.to_graph() if self.parse_graph else None
+
+    @property
+    def rows(self) -> int:
+        return self.array.shape[0]
+
+    @property
+    def columns(self) -> int:
+        return self.array.shape[1]
+
+    def __getitem__(self, point: Vector2D):
+        if isinstance(point, np.ndarray):
+            return self.array[point]
+        if point not in self:
+            raise KeyError(point)
+        return self.array.item(point)
+
+    def __setitem__(self, point: Vector2D, value):
+        if not isinstance(point, np.ndarray) and point not in self:
+            raise KeyError(point)
+        self.array[point] = value
+
+    def __iter__(self):
+        for i in range(self.rows):
+            for j in range(self.columns):
+                yield _new_tuple(Vector2D, (i, j))
+
+    def __len__(self):
+        return self.array.size
+
+    def __contains__(self, point):
+        try:
+            i, j = point
+        except (TypeError, ValueError):
+            return False
+        return 0 <= i < self.rows and 0 <= j < self.columns
+
+    def items(self):
+        return zip(self, self.array.ravel().tolist())
+
+    def neighbors(self, point: Vector2D):
+        i, j = point
+        rows, columns = self.array.shape
+
+        for di, dj in self.directions:
+            if 0 <= i + di < rows and 0 <= j + dj < columns:
+                yield _new_tuple(Vector2D, (i + di, j + dj))
+
+    @functools.cached_property
+    def neighbor_table(self) -> np.ndarray:
+        # Row k holds the flat indices of the neighbors of the cell with flat index k, or -1 where a neighbor
+        # would be off the grid.
+        rows, columns = self.array.shape
+        i, j = np.divmod(np.arange(rows * columns), columns)
+        offsets = np.array(self.directions)
+
+        neighbor_i = i[:, np.newaxis] + offsets[:, 0]
+        neighbor_j = j[:, np.newaxis] + offsets[:, 1]
+        is_inside = (neighbor_i >= 0) & (neighbor_i < rows) & (neighbor_j >= 0) & (neighbor_j < columns)
+
+        return np.where(is_inside, (i * columns + j)[:, np.newaxis] + offsets @ [columns, 1], -1)
+
+    def count_neighbors(self, mask: np.ndarray) -> np.ndarray:
+        # The number of neighbors of each cell for which the mask is set. Off-grid neighbors index the False
+        # appended to the end of the mask.
+        padded_mask = np.append(mask.ravel(), False)
+        return padded_mask[self.neighbor_table].sum(axis=1).reshape(self.array.shape)
+
+    def clone(self):
+        grid = type(self)(self.array.copy(), parse_graph=self.parse_graph)
+        if 'neighbor_table' in self.__dict__:
+            grid.neighbor_table = self.neighbor_table
+        return grid
+
+    def get_index(self, point: Vector2D) -> int:
+        i, j = point
+        return i * self.columns + j
+
+    def get_point(self, index: int) -> Vector2D:
+        return _new_tuple(Vector2D, divmod(index, self.columns))
+
+    def to_csr(
+        self,
+        is_edge: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None,
+        weight: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None,
+    ) -> CSRGraph:
+        # Cells are numbered by their flat index (see get_index). Unlike with Grid, is_edge and weight are called
+        # once, with the arrays of the values at either end of every edge.
+        sources, columns = np.nonzero(self.neighbor_table >= 0)
+        targets = self.neighbor_table[sources, columns]
+
+        values = self.array.ravel()
+        if is_edge is not None:
+            keep = np.asarray(is_edge(values[sources], values[targets]), dtype=bool)
+            sources, targets = sources[keep], targets[keep]
+
+        # The neighbor table is in order of source already.
+        indptr = np.zeros(self.array.size + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=self.array.size), out=indptr[1:])
+
+        return CSRGraph(
+            indptr,
+            targets.astype(np.int32),
+            None if weight is None else np.asarray(weight(values[sources], values[targets])),
+        )
+
+    def to_graph(self):
+        graph = nx.DiGraph() if self.directed else nx.Graph()
+        points = list(self)
+        graph.add_nodes_from(
+            (point, {'value': value})
+            for point, value in zip(points, self.array.ravel().tolist())
+        )
+
+        # The neighbor table lists every edge in both directions, so a directed graph gets both of them.
+        sources, columns = np.nonzero(self.neighbor_table >= 0)
+        targets = self.neighbor_table[sources, columns]
+        graph.add_edges_from(
+            (points[source], points[target])
+            for source, target in zip(sources.tolist(), targets.tolist())
+        )
+
+        return graph
+
+
+class DiagonalDenseGrid(DenseGrid):
+    include_diagonals = True
+
+
+class DirectedDenseGrid(DenseGrid):
+    directed = True
+
+
+def _identity(x):
+    return x
+
+
+def get_grid(
+    input_transformer: Callable[[Any], Any] = _identity,
+    grid_cls: Type[Union[Grid, DenseGrid]] = Grid,
+    value_transformer: Callable[[Any], Any] = _identity,
+    parse_graph: bool = True,
+    **get_input_kwargs
+):
+    problem_file = _get_calling_module().__file__
+
+    if issubclass(grid_cls, DenseGrid):
+        return grid_cls(
+            _get_dense_grid_array(problem_file, input_transformer, value_transformer, get_input_kwargs),
+            parse_graph=parse_graph,
+        )
+
+    points = {}
+    rows = 0
+    columns = 0
+
+    for i, row in enumerate(input_transformer(get_input(problem_file=problem_file, **get_input_kwargs))):
+        rows = i + 1
+        for j, value in enumerate(row):
+            columns = j + 1
+            points[Vector2D(i, j)] = value_transformer(value)
+
+    return grid_cls(points, rows, columns, parse_graph=parse_graph)
+
+
+def _get_dense_grid_array(
+    problem_file: str,
+    input_transformer: Callable[[Any], Any],
+    value_transformer: Callable[[Any], Any],
+    get_input_kwargs: Dict[str, Any],
+) -> np.ndarray:
+    # Grids of digits or characters are decoded straight from the input bytes, without making a Python object
+    # for every cell.
+    if input_transformer is _identity and value_transformer is _identity and get_input_kwargs.get('delimiter') == '':
+        cast = get_input_kwargs.get('cast', int)
+        if get_input_kwargs.keys() <= {'delimiter', 'cast'} and cast in (int, str):
+            if cast is int:
+                return get_digit_grid(problem_file)
+            return get_char_grid(problem_file).view('S1').astype(str)
+
+    return np.array([
+        [value_transformer(value) for value in row]
+        for row in input_transformer(get_input(problem_file=problem_file, **get_input_kwargs))
+    ])
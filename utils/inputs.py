@@ -0,0 +1,562 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import contextlib
+import contextvars
+import copy
+import functools
+import hashlib
+import inspect
+import marshal
+import pathlib
+import pickle
+import re
+import string
+import sys
+import types
+
+import cachetools
+
+from utils import settings
+from utils.lazy import lazy_import
+
+np = lazy_import('numpy')
+parselib = lazy_import('parse')
+
+
+# The input file that parts run on instead of their usual one, if any (see using_input).
+INPUT_PATH: contextvars.ContextVar[Optional[pathlib.Path]] = contextvars.ContextVar('INPUT_PATH', default=None)
+
+# Parsed inputs, keyed by input path, modification time and parse arguments.
+INPUT_CACHE = cachetools.LRUCache(maxsize=64)
+
+
+def _split_line(
+    line: str,
+    delimiter: Optional[str],
+    cast: Callable[[str], Any],
+):
+    if delimiter == '':
+        return list(cast(ch) for ch in line)
+    if delimiter is None:
+        return cast(line)
+
+    if isinstance(delimiter, list):
+        items = re.split('|'.join(delimiter), line)
+    else:
+        assert isinstance(delimiter, str)
+        items = line.split(delimiter)
+
+    return [cast(item) for item in items]
+
+
+@functools.lru_cache(maxsize=None)
+def compile_format(format: str):
+    return parselib.compile(format)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_format_regex(format: str, rstrip: Optional[str]) -> Optional[re.Pattern]:
+    # This reuses the regex that parse builds for the format, anchored to each line of the input so
+    # that the whole input can be matched in one pass. Lines are stripped of trailing whitespace by
+    # default, which is allowed for here as well; any other kind of stripping isn't supported.
+    expression = getattr(compile_format(format), '_expression', None)
+    if expression is None or rstrip not in (None, ''):
+        return None
+
+    trailing = r'[^\S\n]*' if rstrip is None else ''
+    return re.compile(rf'^(?:{expression}){trailing}$', re.MULTILINE | re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_simple_format_types(format: str) -> Optional[tuple]:
+    # Formats made up only of unnamed {} and {:d} fields can be converted without going through parse's
+    # (much slower) general-purpose result evaluation.
+    types_ = []
+    for _, name, spec, conversion in string.Formatter().parse(format):
+        if name is None:
+            continue
+        if name or conversion or spec not in ('', 'd'):
+            return None
+        types_.append(int if spec == 'd' else str)
+
+    return tuple(types_)
+
+
+def _format_result(result):
+    if result is None:
+        return None
+    return result.named if result.named else result.fixed
+
+
+def parse_format(format: str, text: str):
+    return _format_result(compile_format(format).parse(text))
+
+
+def _to_columns(rows: list, format_output: str):
+    if format_output == 'tuple':
+        return rows
+
+    if rows and isinstance(rows[0], dict):
+        columns = {name: [row[name] for row in rows] for name in rows[0]}
+    else:
+        columns = [list(column) for column in zip(*rows)]
+
+    if format_output == 'columns':
+        return columns
+    if format_output == 'array':
+        if isinstance(columns, dict):
+            return {name: np.array(column) for name, column in columns.items()}
+        return [np.array(column) for column in columns]
+
+    raise ValueError(f'Unsupported format output {format_output}')
+
+
+def _convert_matches(format: str, matches: List[re.Match]) -> list:
+    simple_types = _get_simple_format_types(format)
+
+    # Anything int() can't handle (e.g. hex literals, which parse accepts for {:d}) goes through parse.
+    try:
+        if simple_types and all(type_ is int for type_ in simple_types):
+            return [tuple(int(group) for group in match.groups()) for match in matches]
+        if simple_types:
+            return [
+                tuple(type_(group) for type_, group in zip(simple_types, match.groups()))
+                for match in matches
+            ]
+    except ValueError:
+        pass
+
+    parser = compile_format(format)
+    return [_format_result(parser.evaluate_result(match)) for match in matches]
+
+
+# pylint: disable=too-many-arguments
+def _parse_format(
+    content: str,
+    format: str,
+    format_output: str,
+    line_delimiter: str,
+    rstrip: Optional[str],
+    remove_suffix: str,
+    remove_prefix: str,
+):
+    content = content.rstrip()
+    pattern = _compile_format_regex(format, rstrip)
+    rows = None
+
+    if pattern and line_delimiter == '\n' and not remove_suffix and not remove_prefix:
+        matches = list(pattern.finditer(content))
+
+        # If any line doesn't match, fall back to matching line by line so that those lines come back
+        # as None in the right positions.
+        if len(matches) == content.count('\n') + 1:
+            rows = _convert_matches(format, matches)
+
+    if rows is None:
+        rows = [
+            _parse_line(
+                line,
+                rstrip=rstrip,
+                remove_suffix=remove_suffix,
+                remove_prefix=remove_prefix,
+                format=format,
+            )
+            for line in content.split(line_delimiter)
+        ]
+
+    return _to_columns(rows, format_output)
+
+
+# pylint: disable=too-many-arguments
+def _parse_line(
+    line: str,
+    delimiter: Optional[str] = ',',
+    cast: Callable[[str], Any] = int,
+    line_cast: Callable = lambda line: line,
+    rstrip: str = '',
+    remove_suffix: str = '',
+    remove_prefix: str = '',
+    format: Optional[str] = None,
+):
+    line = line.rstrip(rstrip).removeprefix(remove_prefix).removesuffix(remove_suffix)
+
+    if format:
+        return parse_format(format, line)
+
+    return line_cast(_split_line(line, delimiter, cast))
+
+
+# pylint: disable=too-many-arguments
+def parse(
+    content: str,
+    delimiter: Optional[str] = ',',
+    cast: Callable[[str], Any] = int,
+    line_cast: Callable = lambda line: line,
+    line_delimiter: str = '\n',
+    rstrip: str = '',
+    remove_suffix: str = '',
+    remove_prefix: str = '',
+    format: Optional[str] = None,
+    format_output: str = 'tuple',
+):
+    if format:
+        return _parse_format(
+            content,
+            format,
+            format_output,
+            line_delimiter=line_delimiter,
+            rstrip=rstrip,
+            remove_suffix=remove_suffix,
+            remove_prefix=remove_prefix,
+        )
+
+    return [
+        _parse_line(
+            line,
+            delimiter=delimiter,
+            cast=cast,
+            line_cast=line_cast,
+            rstrip=rstrip,
+            remove_suffix=remove_suffix,
+            remove_prefix=remove_prefix,
+        )
+        for line in content.rstrip().split(line_delimiter)
+    ]
+
+
+def _read_records(f, line_delimiter: str, chunk_size: int = 1 << 20):
+    buffer = ''
+
+    while chunk := f.read(chunk_size):
+        buffer += chunk
+
+        # Trailing whitespace at the end of the input is stripped (along with any delimiters in it), so a
+        # record is only complete once something other than whitespace follows it.
+        content = buffer.rstrip()
+        records = content.split(line_delimiter)
+        yield from records[:-1]
+        buffer = records[-1] + buffer[len(content):]
+
+    yield from buffer.rstrip().split(line_delimiter)
+
+
+def _stream_input(input_path: pathlib.Path, line_delimiter: str, format_output: str, **parse_kwargs):
+    if format_output != 'tuple':
+        raise ValueError('Streamed inputs can only be parsed into tuples')
+
+    with open(input_path, 'r', encoding='utf-8') as f:
+        for line in _read_records(f, line_delimiter):
+            yield _parse_line(line, **parse_kwargs)
+
+
+def _get_calling_module():
+    calling_frame = inspect.currentframe().f_back.f_back
+    calling_module = inspect.getmodule(calling_frame)
+    return calling_module
+
+
+@contextlib.contextmanager
+def using_input(path: Union[str, pathlib.Path]):
+    # Parts take no arguments, so an input file to run them on instead of their usual one is passed down through
+    # a context variable, which (unlike a module global) is local to the thread or task that set it.
+    token = INPUT_PATH.set(pathlib.Path(path).resolve())
+    try:
+        yield
+    finally:
+        INPUT_PATH.reset(token)
+
+
+def get_input_path(problem_file: str) -> pathlib.Path:
+    override = INPUT_PATH.get()
+    if override is not None:
+        return override
+
+    problem_path = pathlib.Path(problem_file).resolve()
+    module = problem_path.parent.stem
+    problem_number = problem_path.stem
+    test_prefix = '_test' if settings.IS_TEST else ''
+    input_file_name = f'{problem_number}{test_prefix}.txt'
+
+    return problem_path.parent.parent / 'inputs' / module / input_file_name
+
+
+def _get_callable_key(func: Callable) -> Optional[tuple]:
+    # Lambdas passed to get_input are usually re-created on every call, so functions are keyed by their
+    # code and captured values rather than by identity.
+    if isinstance(func, functools.partial):
+        return (
+            functools.partial,
+            _get_value_key(func.func),
+            tuple(_get_value_key(arg) for arg in func.args),
+            tuple((name, _get_value_key(value)) for name, value in sorted(func.keywords.items())),
+        )
+    # Bound methods pass __code__ through from their function, but also depend on the object they're bound to.
+    if isinstance(func, types.MethodType):
+        return (types.MethodType, _get_callable_key(func.__func__), func.__self__)
+
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return (func,)
+
+    try:
+        closure = tuple(cell.cell_contents for cell in func.__closure__ or ())
+    except ValueError:
+        return (func,)
+
+    return (code, closure, func.__defaults__)
+
+
+def _get_value_key(value: Any) -> Any:
+    if callable(value):
+        return _get_callable_key(value)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _get_input_key(path: pathlib.Path, problem_path: pathlib.Path, parse_kwargs: Dict[str, Any]) -> Optional[tuple]:
+    stat = path.stat()
+    # Casts are keyed by their code, but they may call helpers elsewhere in the solution script, so any edit to
+    # the script invalidates its parsed inputs as well.
+    key = (str(path), stat.st_mtime_ns, stat.st_size, str(problem_path), problem_path.stat().st_mtime_ns)
+
+    for name, value in sorted(parse_kwargs.items()):
+        key += (name, _get_value_key(value))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _fingerprint(item: Any) -> Optional[bytes]:
+    # Returns None for anything that can't be fingerprinted the same way in another process.
+    if isinstance(item, tuple):
+        fingerprints = [_fingerprint(x) for x in item]
+        if None in fingerprints:
+            return None
+        return b'(' + b','.join(fingerprints) + b')'
+    # Code objects are serialized with marshal, since their repr includes their memory address.
+    if isinstance(item, types.CodeType):
+        return marshal.dumps(item)
+
+    # Likewise, the default repr of an object (e.g. a bound method or an instance) includes its memory address.
+    fingerprint = repr(item)
+    return None if ' at 0x' in fingerprint else fingerprint.encode()
+
+
+def _get_disk_cache_path(problem_path: pathlib.Path, key: tuple) -> Optional[pathlib.Path]:
+    fingerprint = _fingerprint(key)
+    if fingerprint is None:
+        return None
+
+    digest = hashlib.sha256(sys.version.encode())
+    digest.update(fingerprint)
+    return problem_path.parent.parent / '.cache' / 'inputs' / digest.hexdigest()
+
+
+def _is_int_matrix(value: Any) -> bool:
+    return (
+        isinstance(value, list) and
+        len(value) > 0 and
+        all(isinstance(row, list) and len(row) == len(value[0]) for row in value) and
+        all(type(item) is int for row in value for item in row)  # pylint: disable=unidiomatic-typecheck
+    )
+
+
+def _load_from_disk(path: pathlib.Path) -> Optional[Any]:
+    if path.with_suffix('.npy').exists():
+        return np.load(path.with_suffix('.npy')).tolist()
+
+    if path.with_suffix('.pickle').exists():
+        with open(path.with_suffix('.pickle'), 'rb') as f:
+            return pickle.load(f)
+
+    return None
+
+
+def _save_to_disk(path: pathlib.Path, value: Any):
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if _is_int_matrix(value):
+        try:
+            np.save(path.with_suffix('.npy'), np.array(value, dtype=np.int64))
+            return
+        except OverflowError:
+            pass
+
+    try:
+        data = pickle.dumps(value)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return
+
+    with open(path.with_suffix('.pickle'), 'wb') as f:
+        f.write(data)
+
+
+def _copy_parsed(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_copy_parsed(item) for item in value]
+    if isinstance(value, (str, int, float, type(None))):
+        return value
+    if isinstance(value, tuple) and all(isinstance(item, (str, int, float)) for item in value):
+        return value
+    return copy.deepcopy(value)
+
+
+# pylint: disable=too-many-arguments
+def get_input(
+    problem_file: Optional[str] = None,
+    delimiter: Optional[str] = ',',
+    cast: Callable[[str], Any] = int,
+    line_cast: Callable = lambda line: line,
+    line_delimiter: str = '\n',
+    rstrip: Optional[str] = None,
+    remove_suffix: str = '',
+    remove_prefix: str = '',
+    format: Optional[str] = None,
+    format_output: str = 'tuple',
+    stream: bool = False,
+):
+    problem_file = problem_file or _get_calling_module().__file__
+    input_path = get_input_path(problem_file)
+    parse_kwargs = {
+        'delimiter': delimiter,
+        'cast': cast,
+        'line_cast': line_cast,
+        'line_delimiter': line_delimiter,
+        'rstrip': rstrip,
+        'remove_suffix': remove_suffix,
+        'remove_prefix': remove_prefix,
+        'format': format,
+        'format_output': format_output,
+    }
+
+    # Streamed inputs are read incrementally and parsed record by record, so they are never cached.
+    if stream:
+        return _stream_input(input_path, **parse_kwargs)
+
+    return _get_cached_input(pathlib.Path(problem_file).resolve(), input_path, parse_kwargs)
+
+
+def _get_cached_input(problem_path: pathlib.Path, input_path: pathlib.Path, parse_kwargs: Dict[str, Any]):
+    key = _get_input_key(input_path, problem_path, parse_kwargs)
+    if key is None:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            return parse(f.read(), **parse_kwargs)
+
+    # Callers are free to mutate what they get back, so the cached result is never handed out directly.
+    if key in INPUT_CACHE:
+        return _copy_parsed(INPUT_CACHE[key])
+
+    # Inputs whose key can't be fingerprinted across processes are only cached in memory.
+    disk_cache_path = _get_disk_cache_path(problem_path, key) if settings.CACHE_INPUTS_ON_DISK else None
+    result = _load_from_disk(disk_cache_path) if disk_cache_path else None
+
+    if result is None:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            result = parse(f.read(), **parse_kwargs)
+
+        if disk_cache_path:
+            _save_to_disk(disk_cache_path, result)
+
+    INPUT_CACHE[key] = result
+    return _copy_parsed(result)
+
+
+def _read_input_bytes(problem_file: str, mmap: bool = False) -> np.ndarray:
+    input_path = get_input_path(problem_file)
+    if mmap:
+        return np.memmap(input_path, dtype=np.uint8, mode='r')
+    return np.fromfile(input_path, dtype=np.uint8)
+
+
+def _find_newline(data: np.ndarray, chunk_size: int = 1 << 16) -> int:
+    # Searched a chunk at a time, so that a memory-mapped input is neither read in full nor copied.
+    for start in range(0, len(data), chunk_size):
+        index = data[start:start + chunk_size].tobytes().find(b'\n')
+        if index >= 0:
+            return start + index
+    return -1
+
+
+def get_char_grid(problem_file: Optional[str] = None, mmap: bool = False) -> np.ndarray:
+    problem_file = problem_file or _get_calling_module().__file__
+    data = _read_input_bytes(problem_file, mmap=mmap)
+
+    # Trailing whitespace (including any trailing newlines) is dropped, as with get_input. It's found by scanning
+    # back from the end, rather than with a mask over the whole input.
+    end = len(data)
+    while end and int(data[end - 1]) in b' \t\r\n':
+        end -= 1
+    data = data[:end]
+
+    newline = _find_newline(data)
+    row_stride = newline + 1 if newline >= 0 else len(data) + 1
+
+    # With Windows line endings, every row but the last (whose trailing whitespace was stripped) ends
+    # in a carriage return.
+    carriage_return = int(newline > 0 and data[newline - 1] == ord('\r'))
+    rows = (len(data) + 1 + carriage_return) // row_stride
+    if (
+        rows * row_stride != len(data) + 1 + carriage_return or
+        not (data[row_stride - 1::row_stride] == ord('\n')).all()
+    ):
+        raise ValueError('Input is not a rectangular grid')
+
+    # Rows are read as a strided view that skips over the line endings, so that memory-mapped inputs
+    # aren't copied.
+    grid = np.lib.stride_tricks.as_strided(
+        data,
+        shape=(rows, row_stride - 1 - carriage_return),
+        strides=(row_stride, 1),
+        writeable=False,
+    )
+
+    return grid if mmap else grid.copy()
+
+
+def get_digit_grid(problem_file: Optional[str] = None, dtype=None, mmap: bool = False) -> np.ndarray:
+    problem_file = problem_file or _get_calling_module().__file__
+
+    # The subtraction wraps around for anything below '0', so every non-digit ends up above 9.
+    digits = get_char_grid(problem_file, mmap=mmap) - np.uint8(ord('0'))
+    if (digits > 9).any():
+        raise ValueError('Input is not a grid of digits')
+
+    # Unless another dtype is asked for, memory-mapped grids are left as uint8, since widening them to int would
+    # copy the grid into memory at 8 times the size of the input.
+    if dtype is None:
+        dtype = np.uint8 if mmap else int
+    return digits.astype(dtype, copy=False)
+
+
+def get_array(
+    problem_file: Optional[str] = None,
+    dtype=None,
+    delimiter: Optional[str] = ',',
+    mmap: bool = False,
+) -> np.ndarray:
+    problem_file = problem_file or _get_calling_module().__file__
+
+    if delimiter == '':
+        return get_digit_grid(problem_file, dtype=dtype, mmap=mmap)
+
+    # Delimited values have to be decoded from text, which reads the whole input into memory anyway.
+    if mmap:
+        raise ValueError("Only grids of digits (with delimiter='') can be memory-mapped")
+
+    with open(get_input_path(problem_file), 'r', encoding='utf-8') as f:
+        content = f.read().rstrip()
+
+    # With a whitespace separator, numpy treats any run of whitespace (including newlines) as a
+    # separator, so every value in the input can be decoded in one go.
+    if delimiter:
+        content = content.replace(delimiter, ' ')
+    values = np.fromstring(content, dtype=int if dtype is None else dtype, sep=' ')
+
+    return values.reshape(content.count('\n') + 1, -1)
@@ -0,0 +1,32 @@
+from typing import Any, Callable, Dict
+
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        # Once loaded, the module's attributes are copied over so that later lookups no longer go
+        # through __getattr__.
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+
+# Constants that depend on numpy are only built on first access (see __getattr__ at the bottom of
+# utils/__init__.py), so that importing utils doesn't import numpy.
+LAZY_CONSTANTS: Dict[str, Callable[[], Any]] = {}
+
+
+def lazy_constant(name: str):
+    def decorator(func):
+        LAZY_CONSTANTS[name] = func
+        return func
+    return decorator
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+import collections
+import heapq
+
+from utils.grids import CSRGraph
+from utils.lazy import lazy_import
+from utils.vectors import get_directions
+
+np = lazy_import('numpy')
+
+
+# The distance to any node that a search didn't reach. Searches that are given a target stop as soon as they reach
+# it, so distances to nodes further away than the target may be unreachable or not yet final.
+UNREACHABLE = -1
+
+Sources = Union[int, Iterable[int]]
+
+
+def _get_sources(sources: Sources) -> List[int]:
+    # Every search takes either a single source node or any number of them, all at distance 0.
+    if isinstance(sources, (int, np.integer)):
+        return [int(sources)]
+    return [int(source) for source in sources]
+
+
+def _get_weights(graph: CSRGraph) -> list:
+    # Unweighted graphs are searched as if every edge had a weight of 1.
+    return graph.weights.tolist() if graph.weights is not None else [1] * len(graph.indices)
+
+
+def _get_heap(sources: Sources, distances: list, get_entry: Callable[[int], tuple]) -> list:
+    # Every source starts out at distance 0, with the heap entry that get_entry makes for it.
+    heap = []
+    for source in _get_sources(sources):
+        distances[source] = 0
+        heap.append(get_entry(source))
+    heapq.heapify(heap)
+    return heap
+
+
+def bfs(graph: CSRGraph, sources: Sources, target: Optional[int] = None) -> np.ndarray:
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    distances = [UNREACHABLE] * len(graph)
+
+    queue = collections.deque(_get_sources(sources))
+    for source in queue:
+        distances[source] = 0
+
+    while queue:
+        node = queue.popleft()
+        if node == target:
+            break
+
+        distance = distances[node] + 1
+        for neighbor in indices[indptr[node]:indptr[node + 1]]:
+            if distances[neighbor] == UNREACHABLE:
+                distances[neighbor] = distance
+                queue.append(neighbor)
+
+    return np.array(distances)
+
+
+def bfs_01(graph: CSRGraph, sources: Sources, target: Optional[int] = None) -> np.ndarray:
+    # For graphs whose edges all weigh 0 or 1: nodes reached over an edge of weight 0 go to the front of the queue,
+    # so that nodes still come off the queue in order of distance, as in Dijkstra's algorithm, without a heap.
+    indptr, indices, weights = graph.indptr.tolist(), graph.indices.tolist(), _get_weights(graph)
+    distances = [UNREACHABLE] * len(graph)
+
+    queue = collections.deque(_get_sources(sources))
+    for source in queue:
+        distances[source] = 0
+
+    while queue:
+        node = queue.popleft()
+        if node == target:
+            break
+
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor, weight = indices[k], weights[k]
+            distance = distances[node] + weight
+
+            if distances[neighbor] == UNREACHABLE or distance < distances[neighbor]:
+                distances[neighbor] = distance
+                if weight:
+                    queue.append(neighbor)
+                else:
+                    queue.appendleft(neighbor)
+
+    return np.array(distances)
+
+
+def dijkstra(graph: CSRGraph, sources: Sources, target: Optional[int] = None) -> np.ndarray:
+    indptr, indices, weights = graph.indptr.tolist(), graph.indices.tolist(), _get_weights(graph)
+    distances = [UNREACHABLE] * len(graph)
+    is_done = [False] * len(graph)
+
+    heap = _get_heap(sources, distances, lambda source: (0, source))
+
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if is_done[node]:
+            continue
+
+        is_done[node] = True
+        if node == target:
+            break
+
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[k]
+            new_distance = distance + weights[k]
+
+            if distances[neighbor] == UNREACHABLE or new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                heapq.heappush(heap, (new_distance, neighbor))
+
+    return np.array(distances)
+
+
+def astar(
+    graph: CSRGraph,
+    sources: Sources,
+    target: int,
+    heuristic: Callable[[int], float] = lambda node: 0,
+) -> Optional[float]:
+    # The heuristic must never overestimate the distance from a node to the target, or the distance found may not
+    # be the shortest one. Returns None if the target can't be reached.
+    indptr, indices, weights = graph.indptr.tolist(), graph.indices.tolist(), _get_weights(graph)
+    distances = [UNREACHABLE] * len(graph)
+    is_done = [False] * len(graph)
+
+    heap = _get_heap(sources, distances, lambda source: (heuristic(source), 0, source))
+
+    while heap:
+        _, distance, node = heapq.heappop(heap)
+        if node == target:
+            return distance
+        if is_done[node]:
+            continue
+
+        is_done[node] = True
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[k]
+            new_distance = distance + weights[k]
+
+            if distances[neighbor] == UNREACHABLE or new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                heapq.heappush(heap, (new_distance + heuristic(neighbor), new_distance, neighbor))
+
+    return None
+
+
+def manhattan_heuristic(columns: int, target: int, min_weight: float = 1) -> Callable[[int], float]:
+    # For graphs over the flat indices of a grid with the given number of columns (see DenseGrid.get_index), where
+    # no edge weighs less than min_weight and edges only join orthogonal neighbors.
+    target_i, target_j = divmod(target, columns)
+
+    def heuristic(node: int) -> float:
+        i, j = divmod(node, columns)
+        return min_weight * (abs(i - target_i) + abs(j - target_j))
+
+    return heuristic
+
+
+def grid_dijkstra(
+    costs: np.ndarray,
+    sources: Iterable[Tuple[int, int]],
+    target: Optional[Tuple[int, int]] = None,
+    include_diagonals: bool = False,
+) -> np.ndarray:
+    # Dijkstra's algorithm over a 2D array, where moving into a cell costs the cell's value, without building a graph
+    # at all. Cells with a negative cost are walls. Returns the array of distances to every cell.
+    rows, columns = costs.shape
+
+    # A border of cells with a negative cost around the grid marks where it ends, so that neighbors can be found by
+    # adding offsets to flat indices without checking bounds.
+    padded_columns = columns + 2
+    padded_costs = np.pad(costs, 1, constant_values=-1).ravel().tolist()
+    offsets = [di * padded_columns + dj for di, dj in get_directions(2, include_diagonals)]
+
+    def get_node(cell: Tuple[int, int]) -> int:
+        return (cell[0] + 1) * padded_columns + cell[1] + 1
+
+    distances = _search_padded_grid(
+        padded_costs,
+        offsets,
+        [get_node(source) for source in sources],
+        None if target is None else get_node(target),
+    )
+
+    return np.array(distances).reshape(rows + 2, padded_columns)[1:-1, 1:-1]
+
+
+def _search_padded_grid(costs: list, offsets: List[int], sources: List[int], target: Optional[int]) -> list:
+    distances = [UNREACHABLE] * len(costs)
+    is_done = [False] * len(costs)
+    heap = _get_heap(sources, distances, lambda source: (0, source))
+
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if is_done[node]:
+            continue
+
+        is_done[node] = True
+        if node == target:
+            break
+
+        for offset in offsets:
+            neighbor = node + offset
+            cost = costs[neighbor]
+            if cost < 0:
+                continue
+
+            new_distance = distance + cost
+            if distances[neighbor] == UNREACHABLE or new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                heapq.heappush(heap, (new_distance, neighbor))
+
+    return distances
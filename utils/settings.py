@@ -0,0 +1,15 @@
+from typing import Callable, ContextManager, List
+
+
+# Module-level globals that the runner sets before running any parts (see runner.execution.configure).
+IS_TEST = False
+IS_TIMED = False
+CACHE_INPUTS_ON_DISK = False
+
+# Context manager factories, called with a part's module name and ID, that are entered around every run of
+# a registered part (e.g. to profile it).
+PART_HOOKS: List[Callable[[str, str], ContextManager]] = []
+
+# Whether utils.checkpoint picks up from the state last saved by an earlier run, rather than starting over.
+RESUME = False
+CHECKPOINT_INTERVAL = 30.0
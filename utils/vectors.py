@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence, Tuple, Union
+
+import enum
+import functools
+import itertools
+
+from utils.lazy import lazy_constant, lazy_import
+
+np = lazy_import('numpy')
+
+
+def sign(x: Union[float, int]) -> int:
+    if x > 0:
+        return 1
+
+    if x < 0:
+        return -1
+
+    return 0
+
+
+class Direction(enum.Enum):
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
+
+class Vector(tuple):
+    __slots__ = ()
+
+    def __new__(cls, *args):
+        if len(args) > 1:
+            return super().__new__(cls, args)
+        return super().__new__(cls, args[0])
+
+    def __add__(self, other):
+        return self.__class__(x + y for x, y in zip(self, other))
+
+    def __radd__(self, other):
+        return self.__class__(x + y for x, y in zip(other, self))
+
+    def __sub__(self, other):
+        return self.__class__(x - y for x, y in zip(self, other))
+
+    def __rsub__(self, other):
+        return self.__class__(x - y for x, y in zip(other, self))
+
+    def __mul__(self, other):
+        return self.__class__(x * other for x in self)
+
+    def __rmul__(self, other):
+        return self.__class__(other * x for x in self)
+
+    def abs(self):
+        return self.__class__(abs(x) for x in self)
+
+    def sign(self):
+        return self.__class__(sign(x) for x in self)
+
+    def dist(self, other, metric='manhattan'):
+        if metric == 'manhattan':
+            return sum((self - other).abs())
+
+        raise ValueError(f'Unsupported distance metric {metric}')
+
+    def neighbors(self, include_diagonals: bool = False, stencil: Optional[Sequence[tuple]] = None) -> list:
+        # A stencil is a sequence of offsets to use instead of the unit directions, e.g. a knight's moves.
+        cls = self.__class__
+        return [
+            cls(x + y for x, y in zip(self, vector))
+            for vector in (get_directions(len(self), include_diagonals) if stencil is None else stencil)
+        ]
+
+    @staticmethod
+    def directions(dims, include_diagonals: bool = False) -> Tuple[tuple, ...]:
+        return get_directions(dims, include_diagonals)
+
+
+@functools.lru_cache(maxsize=None)
+def get_directions(dims: int, include_diagonals: bool = False) -> Tuple[tuple, ...]:
+    # Neighbors are looked up for every point of every flood fill and cellular automaton step, so the offsets are
+    # only worked out once per number of dimensions.
+    return tuple(
+        vector
+        for vector in itertools.product([-1, 0, 1], repeat=dims)
+        if any(vector) and (include_diagonals or len([x for x in vector if x]) == 1)
+    )
+
+
+def neighbors_batch(points, include_diagonals: bool = False, stencil: Optional[Sequence[tuple]] = None):
+    # Expands an (n, dims) array of points into the (n * k, dims) array of their k neighbors each, where the
+    # neighbors of points[i] are rows i * k to (i + 1) * k.
+    points = np.asarray(points)
+    if points.ndim != 2:
+        raise ValueError(f'Expected an (n, dims) array of points, got shape {points.shape}')
+
+    offsets = get_directions(points.shape[1], include_diagonals) if stencil is None else stencil
+    offsets = np.array(offsets, dtype=points.dtype).reshape(-1, points.shape[1])
+    return (points[:, np.newaxis, :] + offsets[np.newaxis, :, :]).reshape(-1, points.shape[1])
+
+
+# Vector2D and Vector3D unroll their arithmetic instead of zipping generators, and build their results (of the
+# same class as self, so that subclasses keep their type) with tuple.__new__ directly. They still hash and compare
+# exactly like plain tuples (a __hash__ of their own would only be slower than tuple's), so they can be mixed freely
+# with tuples as set members and dict keys.
+_new_tuple = tuple.__new__
+
+
+class Vector2D(Vector):
+    __slots__ = ()
+
+    DIRECTION_ALIASES = {
+        **dict.fromkeys([Direction.NORTH, 'N', 'U', 'n', 'u', 'north', 'NORTH', 'up',  'UP'], Direction.NORTH),
+        **dict.fromkeys([Direction.EAST, 'E', 'R', 'e', 'r', 'east', 'EAST', 'right',  'RIGHT'], Direction.EAST),
+        **dict.fromkeys([Direction.SOUTH, 'S', 'D', 's', 'd', 'south', 'SOUTH', 'down',  'DOWN'], Direction.SOUTH),
+        **dict.fromkeys([Direction.WEST, 'W', 'L', 'w', 'l', 'west', 'WEST', 'left',  'LEFT'], Direction.WEST),
+    }
+
+    def __new__(cls, *args):
+        if len(args) == 2:
+            return _new_tuple(cls, args)
+
+        vector = _new_tuple(cls, args[0])
+        assert len(vector) == 2
+        return vector
+
+    def __add__(self, other):
+        x, y = self
+        other_x, other_y = other
+        return _new_tuple(self.__class__, (x + other_x, y + other_y))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        x, y = self
+        other_x, other_y = other
+        return _new_tuple(self.__class__, (x - other_x, y - other_y))
+
+    def __rsub__(self, other):
+        x, y = self
+        other_x, other_y = other
+        return _new_tuple(self.__class__, (other_x - x, other_y - y))
+
+    def __mul__(self, other):
+        x, y = self
+        return _new_tuple(self.__class__, (x * other, y * other))
+
+    __rmul__ = __mul__
+
+    def abs(self):
+        x, y = self
+        return _new_tuple(self.__class__, (abs(x), abs(y)))
+
+    def sign(self):
+        x, y = self
+        return _new_tuple(self.__class__, (sign(x), sign(y)))
+
+    def dist(self, other, metric='manhattan'):
+        if metric == 'manhattan':
+            x, y = self
+            other_x, other_y = other
+            return abs(x - other_x) + abs(y - other_y)
+
+        raise ValueError(f'Unsupported distance metric {metric}')
+
+    def neighbors(self, include_diagonals: bool = False, stencil: Optional[Sequence[tuple]] = None) -> list:
+        x, y = self
+        cls = self.__class__
+        return [
+            _new_tuple(cls, (x + dx, y + dy))
+            for dx, dy in (get_directions(2, include_diagonals) if stencil is None else stencil)
+        ]
+
+    def rot90(self, k: int = 1):
+        k %= 4
+        x, y = self
+
+        if k == 1:
+            return _new_tuple(self.__class__, (-y, x))
+        if k == 2:
+            return _new_tuple(self.__class__, (-x, -y))
+        if k == 3:
+            return _new_tuple(self.__class__, (y, -x))
+
+        return self
+
+    def shift(self, direction: str) -> Vector2D:
+        return self + DIRECTIONS[self.DIRECTION_ALIASES[direction]]
+
+
+class Vector3D(Vector):
+    __slots__ = ()
+
+    def __new__(cls, *args):
+        if len(args) == 3:
+            return _new_tuple(cls, args)
+
+        vector = _new_tuple(cls, args[0])
+        assert len(vector) == 3
+        return vector
+
+    def __add__(self, other):
+        x, y, z = self
+        other_x, other_y, other_z = other
+        return _new_tuple(self.__class__, (x + other_x, y + other_y, z + other_z))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        x, y, z = self
+        other_x, other_y, other_z = other
+        return _new_tuple(self.__class__, (x - other_x, y - other_y, z - other_z))
+
+    def __rsub__(self, other):
+        x, y, z = self
+        other_x, other_y, other_z = other
+        return _new_tuple(self.__class__, (other_x - x, other_y - y, other_z - z))
+
+    def __mul__(self, other):
+        x, y, z = self
+        return _new_tuple(self.__class__, (x * other, y * other, z * other))
+
+    __rmul__ = __mul__
+
+    def abs(self):
+        x, y, z = self
+        return _new_tuple(self.__class__, (abs(x), abs(y), abs(z)))
+
+    def sign(self):
+        x, y, z = self
+        return _new_tuple(self.__class__, (sign(x), sign(y), sign(z)))
+
+    def dist(self, other, metric='manhattan'):
+        if metric == 'manhattan':
+            x, y, z = self
+            other_x, other_y, other_z = other
+            return abs(x - other_x) + abs(y - other_y) + abs(z - other_z)
+
+        raise ValueError(f'Unsupported distance metric {metric}')
+
+    def neighbors(self, include_diagonals: bool = False, stencil: Optional[Sequence[tuple]] = None) -> list:
+        x, y, z = self
+        cls = self.__class__
+        return [
+            _new_tuple(cls, (x + dx, y + dy, z + dz))
+            for dx, dy, dz in (get_directions(3, include_diagonals) if stencil is None else stencil)
+        ]
+
+
+@lazy_constant('NP_ORIGIN')
+def _np_origin():
+    return np.array([
+        [0],
+        [0],
+    ])
+
+
+@lazy_constant('NP_DIRECTIONS')
+def _np_directions():
+    return {
+        Direction.NORTH: np.array([
+            [0],
+            [1],
+        ]),
+        Direction.EAST: np.array([
+            [1],
+            [0],
+        ]),
+        Direction.SOUTH: np.array([
+            [0],
+            [-1],
+        ]),
+        Direction.WEST: np.array([
+            [-1],
+            [0],
+        ]),
+    }
+
+
+ORIGIN = Vector2D(0, 0)
+
+DIRECTIONS = {
+    Direction.NORTH: Vector2D(0, 1),
+    Direction.EAST: Vector2D(1, 0),
+    Direction.SOUTH: Vector2D(0, -1),
+    Direction.WEST: Vector2D(-1, 0),
+}
+
+
+@lazy_constant('ROTATIONS_2D')
+def _rotations_2d():
+    return [
+        np.array(
+            [[1, 0],
+             [0, 1]]
+        ),
+        np.array(
+            [[0, -1],
+             [1, 0]]
+        ),
+        np.array(
+            [[-1, 0],
+             [0, -1]]
+        ),
+        np.array(
+            [[0, 1],
+             [-1, 0]]
+        ),
+    ]
+
+
+@lazy_constant('ROTATIONS_3D')
+def _rotations_3d():
+    return [
+        permutation * signs
+        for permutation, signs in itertools.product(
+            [
+                np.array(permutation)
+                for permutation in itertools.permutations(np.identity(3, dtype=int))
+            ],
+            [
+                np.array(signs)
+                for signs in itertools.product([-1, 1], repeat=3)
+            ],
+        )
+        if np.linalg.det(permutation * signs) == 1
+    ]